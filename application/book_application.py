@@ -1,12 +1,19 @@
 # application/book_application.py
-from typing import List, Optional, Tuple
+import asyncio
+import logging
+from typing import AsyncIterator, List, Optional, Tuple
 from domain.models import BookDomain, ReviewDomain, BookWithReviews
 from domain.services import BookService, ReviewService, LlmService
 
+logger = logging.getLogger(__name__)
+
 class BookApplication:
     """
     Application service that coordinates domain services for book-related operations.
     This class provides methods that correspond to the endpoints in main.py.
+    
+    The book and review services must not share an AsyncSession, since some
+    operations await them concurrently.
     """
     
     def __init__(self, book_service: BookService, review_service: ReviewService, llm_service: LlmService):
@@ -26,31 +33,49 @@ class BookApplication:
             
         Returns:
             The created book domain model
+            
+        Raises:
+            ValueError: If a book with the same title and author already exists
         """
-        # Check if book with same title and author already exists
-        existing_book = await self.book_service.get_book_by_title_and_author(book.title, book.author)
-        if existing_book:
-            raise ValueError("Book with this title and author already exists")
+        if not generate_summary or book.summary:
+            # Title/author uniqueness is enforced by the database (uq_book_title_author),
+            # so the repository raises ValueError for duplicates instead of a pre-check SELECT
+            return await self.book_service.create_book(book)
         
-        # Create the book first
-        created_book = await self.book_service.create_book(book)
+        async def check_duplicate() -> None:
+            existing = await self.book_service.get_book_by_title_and_author(book.title, book.author)
+            # The probe autobegins a transaction; don't keep its pooled connection
+            # checked out for the rest of the LLM call
+            await self.book_service.release_connection()
+            if existing is not None:
+                raise ValueError("Book with this title and author already exists")
         
-        # Generate summary if requested and not provided
-        if generate_summary and not created_book.summary:
+        async def generate() -> None:
             try:
-                # In a real scenario, you might have more book content
-                book_context = f"Generate a brief summary for a book titled '{created_book.title}' by {created_book.author}. Genre: {created_book.genre or 'Unknown'}."
-                summary = await self.llm_service.generate_text_summary(book_context)
-                
-                # Update the book with the generated summary
-                created_book.summary = summary
-                created_book = await self.book_service.update_book(created_book)
-            except Exception as e:
+                # In a real scenario, you might have more book content. Goes through the
+                # book summary prompt, whose exact-match cache keys on title and author, so
+                # the semantic cache can't hand this book a similar-looking book's summary
+                book_content = f"'{book.title}' by {book.author}. Genre: {book.genre or 'Unknown'}."
+                book.summary = await self.llm_service.generate_book_summary(book.title, book_content)
+            except Exception:
                 # Log the error but don't fail the book creation
-                print(f"Error generating summary for '{created_book.title}': {e}")
+                logger.exception("Error generating summary for '%s'", book.title)
                 # You could store an error message or leave summary empty
         
-        return created_book
+        # Overlap the duplicate probe with the slow LLM call; a duplicate
+        # cancels the generation instead of paying for a summary that is thrown away
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(check_duplicate())
+                tg.create_task(generate())
+        except ExceptionGroup as eg:
+            # generate() swallows its own errors, so this is the probe's exception: the
+            # duplicate ValueError or a database error, raised as itself rather than as a group
+            raise eg.exceptions[0] from None
+        
+        # The summary is ready, so the book is still written with a single INSERT;
+        # the unique constraint remains the final word on races with other writers
+        return await self.book_service.create_book(book)
     
     async def get_books(self, skip: int = 0, limit: int = 100) -> List[BookDomain]:
         """
@@ -65,6 +90,19 @@ class BookApplication:
         """
         return await self.book_service.get_books(skip, limit)
     
+    def iter_books(self, skip: int = 0, limit: int = 100) -> AsyncIterator[BookDomain]:
+        """
+        Stream a page of books without loading it all into memory.
+        
+        Args:
+            skip: Number of books to skip
+            limit: Maximum number of books to return
+            
+        Returns:
+            Async iterator of book domain models
+        """
+        return self.book_service.iter_books(skip, limit)
+    
     async def get_book(self, book_id: int) -> Optional[BookDomain]:
         """
         Get a book by its ID.
@@ -77,6 +115,18 @@ class BookApplication:
         """
         return await self.book_service.get_book(book_id)
     
+    async def get_book_with_reviews(self, book_id: int) -> Optional[BookWithReviews]:
+        """
+        Get a book together with all of its reviews.
+        
+        Args:
+            book_id: The ID of the book to retrieve
+            
+        Returns:
+            The book with its reviews if found, None otherwise
+        """
+        return await self.book_service.get_book_with_reviews(book_id)
+    
     async def update_book(self, book_id: int, book_update: BookDomain) -> Optional[BookDomain]:
         """
         Update a book's information.
@@ -88,8 +138,9 @@ class BookApplication:
         Returns:
             The updated book domain model if found, None otherwise
         """
-        # Get the existing book
-        existing_book = await self.book_service.get_book(book_id)
+        # Get the existing book from the database rather than a cache: every field of it
+        # is written back, so a stale cached copy would silently undo other updates
+        existing_book = await self.book_service.get_book_for_update(book_id)
         if not existing_book:
             return None
         
@@ -101,8 +152,10 @@ class BookApplication:
             if conflict_check and conflict_check.id != book_id:
                 raise ValueError("Another book with this title and author already exists")
         
-        # Update the existing book with the new values
-        for field, value in book_update.dict(exclude_unset=True).items():
+        # Update the existing book with the new values, reading only the explicitly
+        # set fields instead of materializing a dict copy of the model
+        for field in book_update.model_fields_set:
+            value = getattr(book_update, field)
             if value is not None:  # Only update non-None values
                 setattr(existing_book, field, value)
         
@@ -120,16 +173,8 @@ class BookApplication:
         Returns:
             The deleted book domain model if found, None otherwise
         """
-        # Get the book first to return its data after deletion
-        book = await self.book_service.get_book(book_id)
-        if not book:
-            return None
-        
-        # Delete the book
-        success = await self.book_service.delete_book(book_id)
-        if success:
-            return book
-        return None
+        # DELETE ... RETURNING hands back the deleted row, so no preceding SELECT is needed
+        return await self.book_service.delete_and_return_book(book_id)
     
     # === Review Operations ===
     
@@ -144,17 +189,14 @@ class BookApplication:
         Returns:
             The created review domain model if the book exists, None otherwise
         """
-        # Verify the book exists
-        book = await self.book_service.get_book(book_id)
-        if not book:
-            return None
-        
         # Ensure the review is for the correct book
         review.book_id = book_id
         
-        # Create the review
-        created_review = await self.review_service.create_review(review)
-        return created_review
+        # The insert itself fails on the books foreign key, so no existence check is needed
+        try:
+            return await self.review_service.create_review(review)
+        except ValueError:
+            return None
     
     async def get_book_reviews(self, book_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
         """
@@ -169,8 +211,7 @@ class BookApplication:
             List of review domain models
         """
         # Verify the book exists
-        book = await self.book_service.get_book(book_id)
-        if not book:
+        if not await self.book_service.book_exists(book_id):
             return []
         
         # Get the reviews
@@ -190,14 +231,21 @@ class BookApplication:
         """
         book = await self.book_service.get_book(book_id)
         if book and not book.summary:
+            # Don't hold a pooled connection for the duration of the LLM call
+            await self.book_service.release_connection()
+            
             # This is a simplified example. In a real application, you would need
             # to have the book content available or fetch it from somewhere.
             book_content = f"This is a placeholder for the content of '{book.title}' by {book.author}."
             summary = await self.llm_service.generate_book_summary(book.title, book_content)
             
-            # Update the book with the generated summary
-            book.summary = summary
-            book = await self.book_service.update_book(book)
+            # Update the book with the generated summary, on top of the stored row rather
+            # than the possibly cached copy read above
+            stored_book = await self.book_service.get_book_for_update(book_id)
+            if stored_book is None:
+                return None
+            stored_book.summary = summary
+            book = await self.book_service.update_book(stored_book)
         
         return book
     
@@ -211,14 +259,12 @@ class BookApplication:
         Returns:
             Tuple of (summary, average_rating) if the book exists, None otherwise
         """
-        # Get the book
-        book = await self.book_service.get_book(book_id)
-        if not book:
+        # Book and rating stats come back from a single joined query
+        result = await self.book_service.get_book_with_rating(book_id)
+        if result is None:
             return None
         
-        # Get the average rating
-        average_rating = await self.review_service.get_average_rating(book_id)
-        
+        book, average_rating, _ = result
         return (book.summary, average_rating)
     
     async def get_recommendations(self, user_id: int, limit: int = 5) -> List[BookDomain]:
@@ -232,16 +278,21 @@ class BookApplication:
         Returns:
             List of recommended book domain models
         """
-        # This is a placeholder implementation
-        # In a real application, you would implement recommendation logic based on:
-        # - User's reading history
-        # - User's ratings
-        # - Similar users' preferences
-        # - Popular books in genres the user likes
-        # - etc.
+        # Ranked by a Bayesian average and filtered of the user's own books in SQL
+        candidates = await self.book_service.get_popular_in_user_genres(user_id, limit)
+        recommendations = [book for book, _, _ in candidates]
+        
+        # Users without history (or with few candidates) fall back to the latest books
+        if len(recommendations) < limit:
+            history = await self.review_service.get_user_reviews(user_id)
+            seen_ids = {review.book_id for review in history} | {book.id for book in recommendations}
+            for book in await self.book_service.get_books(skip=0, limit=limit + len(seen_ids)):
+                if book.id not in seen_ids:
+                    recommendations.append(book)
+                    if len(recommendations) == limit:
+                        break
         
-        # For now, just return the most recent books
-        return await self.book_service.get_books(skip=0, limit=limit)
+        return recommendations
     
     async def generate_summary(self, text: str) -> str:
         """
@@ -1,4 +1,5 @@
 # application/review_application.py
+import asyncio
 from typing import List, Optional, Dict, Any
 from domain.models import ReviewDomain
 from domain.services import ReviewService, BookService, LlmService
@@ -8,10 +9,21 @@ class ReviewApplication:
     Application service that coordinates domain services for review-related operations.
     """
     
-    def __init__(self, review_service: ReviewService, book_service: BookService, llm_service: LlmService):
+    def __init__(
+        self,
+        review_service: ReviewService,
+        book_service: BookService,
+        llm_service: LlmService,
+        review_chunk_size: int = 20,
+        max_llm_concurrency: int = 4,
+    ):
         self.review_service = review_service
         self.book_service = book_service
         self.llm_service = llm_service
+        # Reviews are summarized in chunks of this size, then the partial summaries are reduced
+        self.review_chunk_size = review_chunk_size
+        # Upper bound on in-flight LLM calls per summarization, to respect provider rate limits
+        self.max_llm_concurrency = max_llm_concurrency
     
     async def create_review(self, review: ReviewDomain) -> Optional[ReviewDomain]:
         """
@@ -23,14 +35,11 @@ class ReviewApplication:
         Returns:
             The created review domain model if the book exists, None otherwise
         """
-        # Verify the book exists
-        book = await self.book_service.get_book(review.book_id)
-        if not book:
+        # The insert itself fails on the books foreign key, so no existence check is needed
+        try:
+            return await self.review_service.create_review(review)
+        except ValueError:
             return None
-        
-        # Create the review
-        created_review = await self.review_service.create_review(review)
-        return created_review
     
     async def get_review(self, review_id: int) -> Optional[ReviewDomain]:
         """
@@ -56,14 +65,22 @@ class ReviewApplication:
         Returns:
             List of review domain models
         """
-        # Verify the book exists
-        book = await self.book_service.get_book(book_id)
-        if not book:
-            return []
-        
-        # Get the reviews
+        # A missing book simply has no reviews; callers that need to tell the two
+        # apart check book_exists only when the page comes back empty
         return await self.review_service.get_book_reviews(book_id, skip, limit)
     
+    async def book_exists(self, book_id: int) -> bool:
+        """
+        Check whether a book exists.
+        
+        Args:
+            book_id: The ID of the book
+            
+        Returns:
+            True if the book exists, False otherwise
+        """
+        return await self.book_service.book_exists(book_id)
+    
     async def get_user_reviews(self, user_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
         """
         Get all reviews by a user with pagination.
@@ -76,9 +93,7 @@ class ReviewApplication:
         Returns:
             List of review domain models
         """
-        reviews = await self.review_service.get_user_reviews(user_id)
-        # Apply pagination manually
-        return reviews[skip:skip+limit]
+        return await self.review_service.get_user_reviews(user_id, skip, limit)
     
     async def get_average_rating(self, book_id: int) -> float:
         """
@@ -91,8 +106,7 @@ class ReviewApplication:
             The average rating as a float (0.0 if no ratings)
         """
         # Verify the book exists
-        book = await self.book_service.get_book(book_id)
-        if not book:
+        if not await self.book_service.book_exists(book_id):
             return 0.0
         
         return await self.review_service.get_average_rating(book_id)
@@ -108,22 +122,55 @@ class ReviewApplication:
             A summary of the reviews if the book exists and has reviews, None otherwise
         """
         # Verify the book exists
-        book = await self.book_service.get_book(book_id)
-        if not book:
+        if not await self.book_service.book_exists(book_id):
             return None
         
-        # Get all reviews for the book
-        reviews = await self.review_service.get_book_reviews(book_id)
-        if not reviews:
-            return "No reviews available for this book."
-        
-        # Extract the review texts
-        review_texts = [review.review_text for review in reviews if review.review_text]
-        if not review_texts:
-            return "No text content available in the reviews for this book."
-        
-        # Generate a summary of the reviews
-        return await self.llm_service.summarize_reviews(review_texts)
+        semaphore = asyncio.Semaphore(self.max_llm_concurrency)
+        
+        async def summarize_chunk(chunk: List[str]) -> str:
+            async with semaphore:
+                return await self.llm_service.summarize_reviews(chunk)
+        
+        # Map: stream the reviews and start summarizing each full chunk while the
+        # rest are still being fetched, so DB reads overlap with the LLM calls
+        has_reviews = False
+        chunk: List[str] = []
+        tasks: List[asyncio.Task] = []
+        try:
+            async for review in self.review_service.iter_book_reviews(book_id):
+                has_reviews = True
+                if not review.review_text:
+                    continue
+                chunk.append(review.review_text)
+                if len(chunk) == self.review_chunk_size:
+                    tasks.append(asyncio.create_task(summarize_chunk(chunk)))
+                    chunk = []
+            
+            # All DB work is done; don't hold a pooled connection during the remaining LLM calls
+            await self.review_service.release_connection()
+            
+            if not has_reviews:
+                return "No reviews available for this book."
+            if not tasks and not chunk:
+                return "No text content available in the reviews for this book."
+            
+            # Small review sets fit in a single prompt
+            if not tasks:
+                return await self.llm_service.summarize_reviews(chunk)
+            if chunk:
+                tasks.append(asyncio.create_task(summarize_chunk(chunk)))
+            if len(tasks) == 1:
+                return await tasks[0]
+            
+            partial_summaries = await asyncio.gather(*tasks)
+        finally:
+            # If anything failed (the stream, releasing the connection or one chunk),
+            # don't leave sibling chunk calls running against the LLM; no-op for done tasks
+            for task in tasks:
+                task.cancel()
+        
+        # Reduce: summarize the partial summaries into the final one
+        return await self.llm_service.summarize_reviews(list(partial_summaries))
     
     async def get_book_review_statistics(self, book_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -135,42 +182,10 @@ class ReviewApplication:
         Returns:
             A dictionary with review statistics if the book exists, None otherwise
         """
-        # Verify the book exists
-        book = await self.book_service.get_book(book_id)
-        if not book:
+        # Existence check and aggregation happen in a single query
+        statistics = await self.review_service.get_rating_statistics(book_id)
+        if statistics is None:
             return None
         
-        # Get all reviews for the book
-        reviews = await self.review_service.get_book_reviews(book_id)
-        
-        # Calculate statistics
-        total_reviews = len(reviews)
-        if total_reviews == 0:
-            return {
-                "total_reviews": 0,
-                "average_rating": 0.0,
-                "rating_distribution": {
-                    "1": 0, "2": 0, "3": 0, "4": 0, "5": 0
-                }
-            }
-        
-        # Calculate average rating
-        average_rating = sum(review.rating for review in reviews) / total_reviews
-        
-        # Calculate rating distribution
-        rating_distribution = {
-            "1": 0, "2": 0, "3": 0, "4": 0, "5": 0
-        }
-        
-        for review in reviews:
-            # Round to nearest integer for distribution
-            rounded_rating = round(review.rating)
-            # Ensure it's within our 1-5 range
-            rounded_rating = max(1, min(5, rounded_rating))
-            rating_distribution[str(rounded_rating)] += 1
-        
-        return {
-            "total_reviews": total_reviews,
-            "average_rating": round(average_rating, 2),
-            "rating_distribution": rating_distribution
-        }
+        statistics["average_rating"] = round(statistics["average_rating"], 2)
+        return statistics
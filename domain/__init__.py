@@ -1,9 +1,13 @@
 # domain/__init__.py
+from .batching import BatchQueue
+from .cache import TTLCache
 from .models import BookDomain, ReviewDomain, BookWithReviews
 from .repositories import BookRepositoryProtocol, ReviewRepositoryProtocol, LlmRepositoryProtocol
 from .services import BookService, ReviewService, LlmService
 
 __all__ = [
+    'BatchQueue',
+    'TTLCache',
     'BookDomain',
     'ReviewDomain',
     'BookWithReviews',
@@ -0,0 +1,102 @@
+# domain/batching.py
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+class BatchQueue(Generic[T, R]):
+    """
+    Coalesces concurrent submissions into batched calls.
+    
+    Items submitted within batch_window_ms of each other (up to batch_size) are
+    passed together to batch_fn, which must return one result per item, in order.
+    batch_fn may return an Exception instance in place of a result to fail just
+    that item; if batch_fn raises, every submitter in that batch receives the exception.
+    """
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[List[T]], Awaitable[List[R]]],
+        batch_size: int = 8,
+        batch_window_ms: float = 10.0,
+        max_concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+    ):
+        self.batch_fn = batch_fn
+        self.batch_size = batch_size
+        self.batch_window = batch_window_ms / 1000.0
+        # Maximum number of batches in flight at once
+        self.max_concurrency = max_concurrency
+        # Maximum number of batches started per second (None for unlimited)
+        self.rate_limit = rate_limit
+        
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate_lock = asyncio.Lock()
+        self._next_start = 0.0
+        # Keep references so in-flight batches aren't garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, item: T) -> R:
+        """Queue an item for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.batch_window, self._flush)
+        
+        return await future
+    
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _wait_for_rate_limit(self) -> None:
+        if not self.rate_limit:
+            return
+        async with self._rate_lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = max(now, self._next_start) + 1.0 / self.rate_limit
+    
+    async def _run_batch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        async with self._semaphore:
+            try:
+                await self._wait_for_rate_limit()
+                results = await self.batch_fn([item for item, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        
+        for (_, future), result in zip(batch, results):
+            # A submitter may have been cancelled while the batch ran
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        
+        # zip() stops at the shorter side; never leave submitters waiting forever
+        if len(results) < len(batch):
+            error = RuntimeError(f"batch_fn returned {len(results)} results for {len(batch)} items")
+            for _, future in batch[len(results):]:
+                if not future.done():
+                    future.set_exception(error)
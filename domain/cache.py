@@ -0,0 +1,46 @@
+# domain/cache.py
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Hashable, Tuple, TypeVar
+
+V = TypeVar('V')
+
+# Sentinel distinguishing "not cached" from a cached None
+MISSING: Any = object()
+
+class TTLCache(Generic[V]):
+    """
+    Small in-process LRU cache whose entries expire a fixed time after being set.
+    Not thread-safe; it is meant to be used from a single event loop. Individual
+    operations are atomic there, but a caller that awaits between a lookup and
+    the following store can race with other coroutines doing the same.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+    
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value for key, or default if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entries when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
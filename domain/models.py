@@ -1,5 +1,5 @@
 # domain/models.py
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional
 
 class BookDomain(BaseModel):
@@ -11,14 +11,14 @@ class BookDomain(BaseModel):
     year_published: Optional[int] = None
     summary: Optional[str] = None
     
-    @validator('year_published')
+    model_config = ConfigDict(from_attributes=True)
+    
+    @field_validator('year_published')
+    @classmethod
     def validate_year(cls, v):
         if v is not None and (v < 0 or v > 2100):
             raise ValueError('Year published must be between 0 and 2100')
         return v
-    
-    class Config:
-        orm_mode = True
 
 class ReviewDomain(BaseModel):
     """Domain model for Review entity."""
@@ -28,8 +28,7 @@ class ReviewDomain(BaseModel):
     review_text: Optional[str] = None
     rating: float = Field(..., ge=0.0, le=5.0)
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class BookWithReviews(BookDomain):
     """Domain model for Book with its reviews."""
@@ -1,6 +1,6 @@
 # domain/repositories.py
-from typing import Protocol, List, Optional, TypeVar, Generic
-from .models import BookDomain, ReviewDomain
+from typing import Protocol, List, Optional, TypeVar, Generic, Dict, Any, Tuple, AsyncIterator
+from .models import BookDomain, ReviewDomain, BookWithReviews
 
 T = TypeVar('T')
 
@@ -17,6 +17,10 @@ class RepositoryProtocol(Protocol, Generic[T]):
         """Retrieve all entities with pagination."""
         ...
     
+    def iter_all(self, skip: int = 0, limit: int = 100) -> AsyncIterator[T]:
+        """Stream entities with pagination, without materializing the whole page."""
+        ...
+    
     async def create(self, entity: T) -> T:
         """Create a new entity."""
         ...
@@ -28,12 +32,32 @@ class RepositoryProtocol(Protocol, Generic[T]):
     async def delete(self, id: int) -> bool:
         """Delete an entity by its ID."""
         ...
+    
+    async def release_connection(self) -> None:
+        """End the current unit of work so its database connection returns to the pool."""
+        ...
 
 
 
 class BookRepositoryProtocol(RepositoryProtocol[BookDomain]):
     """Protocol for Book repository operations."""
     
+    async def exists(self, id: int) -> bool:
+        """Check whether a book with the given ID exists."""
+        ...
+    
+    async def get_with_reviews(self, id: int) -> Optional[BookWithReviews]:
+        """Get a book together with all of its reviews."""
+        ...
+    
+    async def get_with_rating(self, id: int) -> Optional[Tuple[BookDomain, float, int]]:
+        """Get a book together with its average rating and review count, or None if it doesn't exist."""
+        ...
+    
+    async def delete_and_return(self, id: int) -> Optional[BookDomain]:
+        """Delete a book by its ID and return the deleted book, or None if it didn't exist."""
+        ...
+    
     async def get_by_title_and_author(self, title: str, author: str) -> Optional[BookDomain]:
         """Get a book by its title and author."""
         ...
@@ -45,22 +69,40 @@ class BookRepositoryProtocol(RepositoryProtocol[BookDomain]):
     async def get_by_year(self, year: int) -> List[BookDomain]:
         """Get all books published in a specific year."""
         ...
+    
+    async def get_popular_in_user_genres(self, user_id: int, limit: int = 20) -> List[Tuple[BookDomain, float, int]]:
+        """
+        Get the best-rated books in the genres a user has reviewed, excluding
+        the books they reviewed, as (book, average_rating, review_count) tuples.
+        """
+        ...
 
 
 class ReviewRepositoryProtocol(RepositoryProtocol[ReviewDomain]):
     """Protocol for Review repository operations."""
     
-    async def get_by_book_id(self, book_id: int) -> List[ReviewDomain]:
-        """Get all reviews for a specific book."""
+    async def get_by_book_id(self, book_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
+        """Get reviews for a specific book with pagination."""
+        ...
+    
+    def iter_by_book_id(self, book_id: int, batch_size: int = 500) -> AsyncIterator[ReviewDomain]:
+        """Stream all reviews for a specific book without loading them all into memory."""
         ...
     
-    async def get_by_user_id(self, user_id: int) -> List[ReviewDomain]:
-        """Get all reviews by a specific user."""
+    async def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
+        """Get reviews by a specific user with pagination."""
         ...
     
     async def get_average_rating_for_book(self, book_id: int) -> float:
         """Get the average rating for a specific book."""
         ...
+    
+    async def get_rating_statistics(self, book_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the review count, average rating and 1-5 rating distribution for a book.
+        Returns None if the book does not exist.
+        """
+        ...
 class LlmRepositoryProtocol(Protocol):
     """Protocol for LLM-based operations."""
     
@@ -74,4 +116,8 @@ class LlmRepositoryProtocol(Protocol):
     
     async def generate_review_summary(self, reviews: List[str]) -> str:
         """Generate a summary of multiple reviews."""
+        ...
+    
+    async def embed(self, text: str) -> List[float]:
+        """Compute an embedding vector for the given text."""
         ...
\ No newline at end of file
@@ -1,8 +1,9 @@
 # domain/services.py
-from typing import List, Optional
-from .models import BookDomain, ReviewDomain
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
+from .models import BookDomain, ReviewDomain, BookWithReviews
 from .repositories import BookRepositoryProtocol, ReviewRepositoryProtocol, LlmRepositoryProtocol
 
+
 class BookService:
     """Service for handling book-related business logic."""
     
@@ -13,10 +14,30 @@ class BookService:
         """Get a book by its ID."""
         return await self.book_repository.get_by_id(book_id)
     
+    async def get_book_for_update(self, book_id: int) -> Optional[BookDomain]:
+        """Get a book straight from the repository, bypassing any cache, as the base for a write."""
+        return await self.book_repository.get_by_id(book_id)
+    
+    async def book_exists(self, book_id: int) -> bool:
+        """Check whether a book exists without loading it."""
+        return await self.book_repository.exists(book_id)
+    
+    async def get_book_with_rating(self, book_id: int) -> Optional[Tuple[BookDomain, float, int]]:
+        """Get a book with its average rating and review count."""
+        return await self.book_repository.get_with_rating(book_id)
+    
+    async def get_book_with_reviews(self, book_id: int) -> Optional[BookWithReviews]:
+        """Get a book together with its reviews."""
+        return await self.book_repository.get_with_reviews(book_id)
+    
     async def get_books(self, skip: int = 0, limit: int = 100) -> List[BookDomain]:
         """Get all books with pagination."""
         return await self.book_repository.get_all(skip, limit)
     
+    def iter_books(self, skip: int = 0, limit: int = 100) -> AsyncIterator[BookDomain]:
+        """Stream books with pagination."""
+        return self.book_repository.iter_all(skip, limit)
+    
     async def create_book(self, book: BookDomain) -> BookDomain:
         """Create a new book."""
         return await self.book_repository.create(book)
@@ -29,10 +50,22 @@ class BookService:
         """Delete a book by its ID."""
         return await self.book_repository.delete(book_id)
     
+    async def delete_and_return_book(self, book_id: int) -> Optional[BookDomain]:
+        """Delete a book by its ID and return it, or None if it didn't exist."""
+        return await self.book_repository.delete_and_return(book_id)
+    
+    async def release_connection(self) -> None:
+        """Release the database connection, e.g. before a slow LLM call."""
+        await self.book_repository.release_connection()
+    
     async def get_books_by_genre(self, genre: str) -> List[BookDomain]:
         """Get all books of a specific genre."""
         return await self.book_repository.get_by_genre(genre)
     
+    async def get_popular_in_user_genres(self, user_id: int, limit: int = 20) -> List[Tuple[BookDomain, float, int]]:
+        """Get the best-rated books in the genres a user has reviewed, with their rating stats."""
+        return await self.book_repository.get_popular_in_user_genres(user_id, limit)
+    
     async def get_book_by_title_and_author(self, title: str, author: str) -> Optional[BookDomain]:
         """Get a book by its title and author."""
         return await self.book_repository.get_by_title_and_author(title, author)
@@ -54,17 +87,27 @@ class ReviewService:
     
     async def get_book_reviews(self, book_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
         """Get all reviews for a specific book with pagination."""
-        reviews = await self.review_repository.get_by_book_id(book_id)
-        # Apply pagination manually if the repository doesn't support it
-        return reviews[skip:skip+limit]
+        return await self.review_repository.get_by_book_id(book_id, skip, limit)
     
-    async def get_user_reviews(self, user_id: int) -> List[ReviewDomain]:
-        """Get all reviews by a specific user."""
-        return await self.review_repository.get_by_user_id(user_id)
+    def iter_book_reviews(self, book_id: int) -> AsyncIterator[ReviewDomain]:
+        """Stream all reviews for a specific book."""
+        return self.review_repository.iter_by_book_id(book_id)
+    
+    async def get_user_reviews(self, user_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
+        """Get all reviews by a specific user with pagination."""
+        return await self.review_repository.get_by_user_id(user_id, skip, limit)
+    
+    async def release_connection(self) -> None:
+        """Release the database connection, e.g. before a slow LLM call."""
+        await self.review_repository.release_connection()
     
     async def get_average_rating(self, book_id: int) -> float:
         """Get the average rating for a book."""
         return await self.review_repository.get_average_rating_for_book(book_id)
+    
+    async def get_rating_statistics(self, book_id: int) -> Optional[Dict[str, Any]]:
+        """Get aggregated rating statistics for a book, or None if the book doesn't exist."""
+        return await self.review_repository.get_rating_statistics(book_id)
 
 
 class LlmService:
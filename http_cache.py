@@ -0,0 +1,26 @@
+# http_cache.py
+# HTTP caching helpers for the idempotent GET endpoints.
+
+import hashlib
+import os
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+# Cache hints for idempotent GETs, so a CDN or reverse proxy can absorb repeat traffic
+HTTP_CACHE_CONTROL = os.getenv("HTTP_CACHE_CONTROL", "public, max-age=60, stale-while-revalidate=300")
+
+def conditional_response(request: Request, payload: BaseModel) -> Response:
+    """
+    Serialize payload with an ETag and Cache-Control header, answering 304 Not
+    Modified when the client's If-None-Match already has this representation.
+    """
+    body = payload.model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
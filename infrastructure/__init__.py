@@ -1,9 +1,18 @@
 # infrastructure/__init__.py
 from .postgres import PostgresBookRepository, PostgresReviewRepository
-from .llm import LlmRepository
+from .llm import LlmRepository, get_llm_repository, CachedLlmRepository, LLM_SEMANTIC_CACHE, close_ollama_client
+from .cache import get_redis, close_redis, CachedBookService, CachedReviewService
 
 __all__ = [
     'PostgresBookRepository',
     'PostgresReviewRepository',
     'LlmRepository',
+    'get_llm_repository',
+    'CachedLlmRepository',
+    'LLM_SEMANTIC_CACHE',
+    'close_ollama_client',
+    'get_redis',
+    'close_redis',
+    'CachedBookService',
+    'CachedReviewService',
 ]
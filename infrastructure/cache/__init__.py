@@ -0,0 +1,10 @@
+# infrastructure/cache/__init__.py
+from .redis_client import get_redis, close_redis
+from .cached_services import CachedBookService, CachedReviewService
+
+__all__ = [
+    'get_redis',
+    'close_redis',
+    'CachedBookService',
+    'CachedReviewService',
+]
@@ -0,0 +1,113 @@
+# infrastructure/cache/cached_services.py
+import logging
+import os
+from typing import Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from domain.models import BookDomain, ReviewDomain
+from domain.repositories import BookRepositoryProtocol, ReviewRepositoryProtocol
+from domain.services import BookService, ReviewService
+
+logger = logging.getLogger(__name__)
+
+BOOK_CACHE_TTL = int(os.getenv("BOOK_CACHE_TTL", "300"))  # seconds
+RATING_CACHE_TTL = int(os.getenv("RATING_CACHE_TTL", "60"))  # seconds
+
+def book_key(book_id: int) -> str:
+    return f"book:{book_id}"
+
+def average_rating_key(book_id: int) -> str:
+    return f"avg:{book_id}"
+
+
+class _RedisCacheMixin:
+    """
+    Best-effort Redis access: cache errors are logged and treated as misses
+    so that an unavailable Redis never fails the request.
+    """
+    
+    redis: Redis
+    
+    async def _cache_get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.redis.get(key)
+        except RedisError as e:
+            logger.warning("Redis GET failed for '%s': %s", key, e)
+            return None
+    
+    async def _cache_set(self, key: str, ttl: int, value: str) -> None:
+        try:
+            await self.redis.setex(key, ttl, value)
+        except RedisError as e:
+            logger.warning("Redis SETEX failed for '%s': %s", key, e)
+    
+    async def _cache_delete(self, *keys: str) -> None:
+        try:
+            await self.redis.delete(*keys)
+        except RedisError as e:
+            logger.warning("Redis DELETE failed for %s: %s", keys, e)
+
+
+class CachedBookService(_RedisCacheMixin, BookService):
+    """BookService with a cache-aside layer for lookups by ID."""
+    
+    def __init__(self, book_repository: BookRepositoryProtocol, redis: Redis, ttl: int = BOOK_CACHE_TTL):
+        super().__init__(book_repository)
+        self.redis = redis
+        self.ttl = ttl
+    
+    async def get_book(self, book_id: int) -> Optional[BookDomain]:
+        """Get a book by its ID, serving it from Redis when cached."""
+        key = book_key(book_id)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return BookDomain.model_validate_json(cached)
+        
+        book = await super().get_book(book_id)
+        if book is not None:
+            await self._cache_set(key, self.ttl, book.model_dump_json())
+        return book
+    
+    async def update_book(self, book: BookDomain) -> BookDomain:
+        """Update an existing book and invalidate its cache entry."""
+        updated_book = await super().update_book(book)
+        await self._cache_delete(book_key(updated_book.id))
+        return updated_book
+    
+    async def delete_book(self, book_id: int) -> bool:
+        """Delete a book and invalidate its cached data (its reviews are deleted too)."""
+        deleted = await super().delete_book(book_id)
+        await self._cache_delete(book_key(book_id), average_rating_key(book_id))
+        return deleted
+    
+    async def delete_and_return_book(self, book_id: int) -> Optional[BookDomain]:
+        """Delete and return a book, invalidating its cached data."""
+        deleted_book = await super().delete_and_return_book(book_id)
+        await self._cache_delete(book_key(book_id), average_rating_key(book_id))
+        return deleted_book
+
+
+class CachedReviewService(_RedisCacheMixin, ReviewService):
+    """ReviewService with a short-lived cache for average ratings."""
+    
+    def __init__(self, review_repository: ReviewRepositoryProtocol, redis: Redis, rating_ttl: int = RATING_CACHE_TTL):
+        super().__init__(review_repository)
+        self.redis = redis
+        self.rating_ttl = rating_ttl
+    
+    async def create_review(self, review: ReviewDomain) -> ReviewDomain:
+        """Create a new review and invalidate the book's cached average rating."""
+        created_review = await super().create_review(review)
+        await self._cache_delete(average_rating_key(created_review.book_id))
+        return created_review
+    
+    async def get_average_rating(self, book_id: int) -> float:
+        """Get the average rating for a book, serving it from Redis when cached."""
+        key = average_rating_key(book_id)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return float(cached)
+        
+        average_rating = await super().get_average_rating(book_id)
+        await self._cache_set(key, self.rating_ttl, str(average_rating))
+        return average_rating
@@ -0,0 +1,24 @@
+# infrastructure/cache/redis_client.py
+import os
+from typing import Optional
+from redis.asyncio import Redis
+
+# Caching is enabled only when a Redis URL is configured
+REDIS_URL = os.getenv("REDIS_URL")
+
+_redis: Optional[Redis] = None
+
+def get_redis() -> Optional[Redis]:
+    """Return the process-wide Redis client, or None if caching is not configured."""
+    global _redis
+    if REDIS_URL and _redis is None:
+        # The client holds a connection pool, so it is created once and shared
+        _redis = Redis.from_url(REDIS_URL)
+    return _redis
+
+async def close_redis() -> None:
+    """Close the shared Redis client's connection pool, e.g. on application shutdown."""
+    global _redis
+    if _redis is not None:
+        client, _redis = _redis, None
+        await client.aclose()
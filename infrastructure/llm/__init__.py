@@ -1,6 +1,15 @@
 # infrastructure/llm/__init__.py
-from .llm_repository import LlmRepository
+from .llm_repository import LlmRepository, get_llm_repository
+from .cached_llm_repository import CachedLlmRepository, LLM_SEMANTIC_CACHE
+from .semantic_cache import SemanticCache
+from .ollama_client import get_ollama_client, close_ollama_client
 
 __all__ = [
     'LlmRepository',
+    'get_llm_repository',
+    'CachedLlmRepository',
+    'LLM_SEMANTIC_CACHE',
+    'SemanticCache',
+    'get_ollama_client',
+    'close_ollama_client',
 ]
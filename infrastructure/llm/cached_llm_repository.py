@@ -0,0 +1,76 @@
+# infrastructure/llm/cached_llm_repository.py
+import logging
+import os
+from typing import List
+from domain.repositories import LlmRepositoryProtocol
+from .semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+LLM_SEMANTIC_CACHE = os.getenv("LLM_SEMANTIC_CACHE", "false").lower() == "true"
+LLM_SEMANTIC_CACHE_THRESHOLD = float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0.92"))
+LLM_SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("LLM_SEMANTIC_CACHE_MAX_ENTRIES", "1024"))
+LLM_SEMANTIC_CACHE_TTL = float(os.getenv("LLM_SEMANTIC_CACHE_TTL", "3600"))  # seconds
+# Review sets for the same book are highly self-similar, so they get a stricter
+# threshold and a larger capacity than free-text summaries
+LLM_REVIEW_CACHE_THRESHOLD = float(os.getenv("LLM_REVIEW_CACHE_THRESHOLD", "0.95"))
+LLM_REVIEW_CACHE_MAX_ENTRIES = int(os.getenv("LLM_REVIEW_CACHE_MAX_ENTRIES", "10000"))
+
+def _new_cache(threshold: float, max_entries: int) -> SemanticCache:
+    return SemanticCache(threshold=threshold, max_entries=max_entries, ttl=LLM_SEMANTIC_CACHE_TTL)
+
+class CachedLlmRepository(LlmRepositoryProtocol):
+    """
+    LLM repository decorator that serves near-duplicate summary requests from a
+    semantic cache instead of calling the model again.
+    """
+    
+    def __init__(self, llm_repository: LlmRepositoryProtocol):
+        self.llm_repository = llm_repository
+        # Separate caches so free text never matches a set of reviews
+        self.summary_cache = _new_cache(LLM_SEMANTIC_CACHE_THRESHOLD, LLM_SEMANTIC_CACHE_MAX_ENTRIES)
+        self.review_summary_cache = _new_cache(LLM_REVIEW_CACHE_THRESHOLD, LLM_REVIEW_CACHE_MAX_ENTRIES)
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    async def _cached_generate(self, cache: SemanticCache, cache_input: str, generate) -> str:
+        try:
+            embedding = await self.llm_repository.embed(cache_input)
+        except Exception as e:
+            # The cache is an optimization; fall back to a plain LLM call
+            logger.warning("Error embedding input for the semantic cache: %s", e)
+            return await generate()
+        
+        cached = cache.get(embedding)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        
+        self.cache_misses += 1
+        result = await generate()
+        cache.set(embedding, result)
+        return result
+    
+    async def generate_summary(self, text: str) -> str:
+        """Generate a summary for the given text, reusing one for a near-identical text."""
+        return await self._cached_generate(
+            self.summary_cache, text,
+            lambda: self.llm_repository.generate_summary(text),
+        )
+    
+    async def generate_book_summary(self, book_title: str, book_content: str) -> str:
+        """Generate a summary specifically for a book."""
+        # Not semantically cached: prompts for different books differ only in a few
+        # title/author tokens, so they would match well above the threshold
+        return await self.llm_repository.generate_book_summary(book_title, book_content)
+    
+    async def generate_review_summary(self, reviews: List[str]) -> str:
+        """Generate a summary of multiple reviews, reusing one for a near-identical set."""
+        return await self._cached_generate(
+            self.review_summary_cache, "\n".join(reviews),
+            lambda: self.llm_repository.generate_review_summary(reviews),
+        )
+    
+    async def embed(self, text: str) -> List[float]:
+        """Compute an embedding vector for the given text."""
+        return await self.llm_repository.embed(text)
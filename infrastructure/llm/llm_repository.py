@@ -1,92 +1,220 @@
 # infrastructure/llm/llm_repository.py
+import asyncio
+import functools
+import hashlib
+import json
+import logging
 import os
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 import ollama
+from domain.batching import BatchQueue
+from domain.cache import MISSING, TTLCache
 from domain.repositories import LlmRepositoryProtocol
+from .ollama_client import get_ollama_client
+
+logger = logging.getLogger(__name__)
+
+# Exact-match cache of generated responses, keyed by (model, prompt, options) and
+# shared by every LlmRepository in the process. Set OLLAMA_CACHE_TTL=0 to disable it.
+OLLAMA_CACHE_TTL = float(os.getenv("OLLAMA_CACHE_TTL", "300"))  # seconds
+OLLAMA_CACHE_SIZE = int(os.getenv("OLLAMA_CACHE_SIZE", "1024"))
+_prompt_cache: TTLCache[str] = TTLCache(maxsize=OLLAMA_CACHE_SIZE, ttl=OLLAMA_CACHE_TTL)
+
+# Generate calls arriving within LLM_BATCH_WINDOW_MS of each other are dispatched together
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "8"))
+LLM_BATCH_WINDOW_MS = float(os.getenv("LLM_BATCH_WINDOW_MS", "10"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # batches in flight
+_llm_rate_limit = os.getenv("LLM_RATE_LIMIT")  # batches per second
+LLM_RATE_LIMIT = float(_llm_rate_limit) if _llm_rate_limit else None
+
+# Output caps per kind of summary, sized to the length each prompt asks for; decode
+# time grows with output length. OLLAMA_MAX_TOKENS still bounds all of them.
+FREE_SUMMARY_MAX_TOKENS = int(os.getenv("FREE_SUMMARY_MAX_TOKENS", "256"))
+BOOK_SUMMARY_MAX_TOKENS = int(os.getenv("BOOK_SUMMARY_MAX_TOKENS", "180"))
+REVIEW_SUMMARY_MAX_TOKENS = int(os.getenv("REVIEW_SUMMARY_MAX_TOKENS", "120"))
+# Stop as soon as the model starts another section instead of padding the answer
+STOP_SEQUENCES = ["\n\nSummary:", "\n\n\n"]
+
+# Input caps, so a huge book or a single long review can't blow up prefill time or the
+# KV cache. Lengths are estimated at ~4 characters per token rather than tokenized,
+# since the Llama tokenizer isn't available client-side.
+CHARS_PER_TOKEN = 4
+BOOK_CONTENT_MAX_TOKENS = int(os.getenv("BOOK_CONTENT_MAX_TOKENS", "6000"))
+REVIEW_MAX_TOKENS = int(os.getenv("REVIEW_MAX_TOKENS", "300"))  # per review
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """Cut text to roughly max_tokens tokens."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    return text if len(text) <= max_chars else text[:max_chars]
+
+# Prompt templates, built once and free of source indentation, which would otherwise
+# be sent to the model as extra input tokens
+_SUMMARY_TMPL = "Summarize the following text in at most 150 words. No preamble.\n\n{text}"
+_BOOK_TMPL = (
+    'Write a one-paragraph summary of at most 100 words of the book titled "{title}". No preamble.\n\n'
+    'Book Content:\n"""\n{content}\n"""\n\n'
+    'Summary:'
+)
+_REVIEW_TMPL = (
+    "Summarize the key points and overall sentiment from these book reviews in at most 80 words. No preamble.\n\n"
+    "Reviews:\n{reviews}\n\n"
+    "Summary:"
+)
 
 class LlmRepository(LlmRepositoryProtocol):
     """Implementation of the LLM repository using the local Llama model."""
     
-    def __init__(self):
-        """Initialize the LLM client."""
-        # Configure Ollama client
-        ollama_host = os.getenv("OLLAMA_API_URL", "http://localhost:11434")
-        # Set the Ollama host for the client
-        ollama.host = ollama_host
-        
+    def __init__(self, prompt_cache: Optional[TTLCache] = None):
+        """Initialize the LLM configuration."""
         # Store configuration parameters
         self.model = os.getenv("OLLAMA_MODEL", "llama2")
         self.max_tokens = int(os.getenv("OLLAMA_MAX_TOKENS", "2048"))
         self.temperature = float(os.getenv("OLLAMA_TEMPERATURE", "0.7"))
         self.top_p = float(os.getenv("OLLAMA_TOP_P", "0.9"))
+        self.embedding_model = os.getenv("OLLAMA_EMBED_MODEL", "nomic-embed-text")
+        self.prompt_cache = _prompt_cache if prompt_cache is None else prompt_cache
+        # Generations currently running, by cache key, so concurrent identical requests
+        # share one call instead of all missing the cache while the first is in flight
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        # Every generate call goes through the batcher, whatever method it came from
+        self.batcher: BatchQueue[Tuple[str, Dict[str, Any]], str] = BatchQueue(
+            self._generate_batch,
+            batch_size=LLM_BATCH_SIZE,
+            batch_window_ms=LLM_BATCH_WINDOW_MS,
+            max_concurrency=LLM_MAX_CONCURRENCY,
+            rate_limit=LLM_RATE_LIMIT,
+        )
+    
+    @property
+    def client(self) -> ollama.AsyncClient:
+        """
+        The shared Ollama client, so connections are pooled and kept alive across requests.
+        Looked up on every call rather than stored: this repository outlives the client,
+        which is closed on shutdown and recreated by the next application lifespan.
+        """
+        return get_ollama_client()
+    
+    def _options(self, max_tokens: int) -> Dict[str, Any]:
+        """Sampling options for a generate call producing at most max_tokens tokens."""
+        return {
+            "num_predict": min(max_tokens, self.max_tokens),
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "stop": STOP_SEQUENCES,
+        }
+    
+    def _cache_key(self, prompt: str, options: Dict[str, Any]) -> str:
+        """Hash the model, prompt and options into a compact cache key."""
+        raw = f"{self.model}\x00{prompt}\x00{json.dumps(options, sort_keys=True)}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    async def _generate(self, prompt: str, max_tokens: int) -> str:
+        """
+        Run a generate call, serving identical recent requests from the prompt cache
+        and joining an identical request that is already in flight.
+        """
+        options = self._options(max_tokens)
+        if self.prompt_cache.ttl <= 0:
+            return await self.batcher.submit((prompt, options))
+        
+        key = self._cache_key(prompt, options)
+        cached = self.prompt_cache.get(key, MISSING)
+        if cached is not MISSING:
+            return cached
+        
+        # The cache is only filled once the generation returns, so without this every
+        # identical request arriving in the meantime would reach Ollama as well
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate_and_cache(key, prompt, options))
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._forget_in_flight, key))
+        # Shielded, so one caller being cancelled doesn't cancel the call for the others
+        return await asyncio.shield(task)
+    
+    async def _generate_and_cache(self, key: str, prompt: str, options: Dict[str, Any]) -> str:
+        text = await self.batcher.submit((prompt, options))
+        self.prompt_cache.set(key, text)
+        return text
+    
+    def _forget_in_flight(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark a failure as retrieved: if every waiter was cancelled, nobody awaits the
+        # shielded task and asyncio would log "Task exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+    
+    async def _generate_batch(self, requests: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Dispatch one batch of (prompt, options) requests concurrently, so Ollama's
+        continuous batching can schedule them together. Identical requests in the
+        batch share one call, and a failed request only fails its own submitters.
+        """
+        unique: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        keys = []
+        for prompt, options in requests:
+            key = self._cache_key(prompt, options)
+            unique.setdefault(key, (prompt, options))
+            keys.append(key)
+        
+        responses = await asyncio.gather(
+            *(self.client.generate(model=self.model, prompt=prompt, options=options)
+              for prompt, options in unique.values()),
+            return_exceptions=True,
+        )
+        texts = {
+            key: response if isinstance(response, Exception) else response['response'].strip()
+            for key, response in zip(unique, responses)
+        }
+        return [texts[key] for key in keys]
     
     async def generate_summary(self, text: str) -> str:
         """Generate a summary for the given text using the LLM."""
-        prompt = f"Please summarize the following text concisely:\n\n{text}"
+        prompt = _SUMMARY_TMPL.format(text=text)
         
         try:
-            response = await ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={
-                    "num_predict": self.max_tokens,
-                    "temperature": self.temperature,
-                    "top_p": self.top_p
-                }
-            )
-            return response['response'].strip()
+            return await self._generate(prompt, FREE_SUMMARY_MAX_TOKENS)
         except Exception as e:
-            print(f"Error during summary generation: {e}")
+            logger.exception("Error during summary generation")
             raise RuntimeError(f"AI summary generation failed.") from e
     
     async def generate_book_summary(self, book_title: str, book_content: str) -> str:
         """Generate a summary specifically for a book."""
-        prompt = f"""Please provide a concise, one-paragraph summary (around 50-100 words) of the book titled "{book_title}":
-
-        Book Content:
-        \"\"\"
-        {book_content}
-        \"\"\"
-
-        Summary:"""
+        prompt = _BOOK_TMPL.format(title=book_title, content=_truncate(book_content, BOOK_CONTENT_MAX_TOKENS))
         
         try:
             # Generate the summary
-            response = await ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={
-                    "num_predict": self.max_tokens,
-                    "temperature": self.temperature,
-                    "top_p": self.top_p
-                }
-            )
-            return response['response'].strip()
+            return await self._generate(prompt, BOOK_SUMMARY_MAX_TOKENS)
         except Exception as e:
-            print(f"Error during book summary generation: {e}")
+            logger.exception("Error during book summary generation")
             raise RuntimeError(f"AI book summary generation failed.") from e
     
     async def generate_review_summary(self, reviews: List[str]) -> str:
         """Generate a summary of multiple reviews."""
-        combined_reviews = "\n".join(f"- {r}" for r in reviews)
-        prompt = f"""Summarize the key points and overall sentiment from these book reviews:
-
-        Reviews:
-        {combined_reviews}
-
-        Summary:"""
+        # Truncated per review, so one very long review can't crowd out the others
+        truncated = [_truncate(r, REVIEW_MAX_TOKENS) for r in reviews]
+        # A single join over a list lets str.join size the result up front
+        combined_reviews = "- " + "\n- ".join(truncated) if truncated else ""
+        prompt = _REVIEW_TMPL.format(reviews=combined_reviews)
         
         try:
-            response = await ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={
-                    "num_predict": self.max_tokens,
-                    "temperature": self.temperature,
-                    "top_p": self.top_p
-                }
-            )
-            return response['response'].strip()
+            return await self._generate(prompt, REVIEW_SUMMARY_MAX_TOKENS)
         except Exception as e:
-            print(f"Error during review summary generation: {e}")
+            logger.exception("Error during review summary generation")
             raise RuntimeError(f"AI review summary generation failed.") from e
+    
+    async def embed(self, text: str) -> List[float]:
+        """Compute an embedding vector for the given text."""
+        try:
+            response = await self.client.embeddings(model=self.embedding_model, prompt=text)
+            return response['embedding']
+        except Exception as e:
+            logger.exception("Error during embedding generation")
+            raise RuntimeError("AI embedding generation failed.") from e
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_repository() -> LlmRepository:
+    """Return the process-wide LlmRepository, so config and caches are built once."""
+    return LlmRepository()
@@ -0,0 +1,35 @@
+# infrastructure/llm/ollama_client.py
+import os
+from typing import Optional
+import httpx
+import ollama
+
+OLLAMA_API_URL = os.getenv("OLLAMA_API_URL", "http://localhost:11434")
+OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "120"))  # seconds, per generation
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "32"))
+
+_client: Optional[ollama.AsyncClient] = None
+
+def get_ollama_client() -> ollama.AsyncClient:
+    """Return the process-wide Ollama client."""
+    global _client
+    if _client is None:
+        # The underlying httpx client keeps a pool of keep-alive connections, so it is
+        # created once and shared instead of reconnecting on every request
+        _client = ollama.AsyncClient(
+            host=OLLAMA_API_URL,
+            timeout=httpx.Timeout(OLLAMA_TIMEOUT, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=OLLAMA_MAX_CONNECTIONS,
+                max_keepalive_connections=OLLAMA_MAX_CONNECTIONS // 2,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _client
+
+async def close_ollama_client() -> None:
+    """Close the shared Ollama client's connection pool, e.g. on application shutdown."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
@@ -0,0 +1,73 @@
+# infrastructure/llm/semantic_cache.py
+import time
+from typing import List, Optional, Sequence
+import numpy as np
+
+class SemanticCache:
+    """
+    In-process cache that maps input embeddings to generated outputs.
+    A lookup hits when the cosine similarity between the query embedding and
+    a stored one reaches the configured threshold.
+    
+    Embeddings live in a preallocated float32 ring buffer, so inserts overwrite
+    the oldest slot in place (FIFO eviction) instead of copying the matrix, and
+    a lookup is a single BLAS matrix-vector product over the filled rows.
+    """
+    
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1024, ttl: float = 3600.0):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Row i of _vectors is the L2-normalized embedding for _values[i];
+        # allocated on the first insert, once the embedding dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._values: List[Optional[str]] = [None] * max_entries
+        self._expires_at = np.zeros(max_entries, dtype=np.float64)
+        self._size = 0
+        self._next = 0
+    
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+    
+    def get(self, embedding: Sequence[float]) -> Optional[str]:
+        """Return the cached output for the most similar stored input, if similar enough."""
+        query = self._normalize(embedding)
+        if query is None or self._size == 0 or self._vectors.shape[1] != query.shape[0]:
+            return None
+        
+        # Normalized vectors: the dot product is the cosine similarity
+        similarities = np.dot(self._vectors[:self._size], query)
+        # Expired entries can't win, even if they are the closest match
+        similarities[self._expires_at[:self._size] <= time.monotonic()] = -1.0
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        return self._values[best]
+    
+    def set(self, embedding: Sequence[float], value: str) -> None:
+        """Store an output for the given input embedding, evicting the oldest entry when full."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            # First entry, or the embedding model changed dimensions: start over
+            self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+            self._values = [None] * self.max_entries
+            self._size = 0
+            self._next = 0
+        
+        slot = self._next
+        self._vectors[slot] = vector
+        self._values[slot] = value
+        self._expires_at[slot] = time.monotonic() + self.ttl
+        self._next = (slot + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+    
+    def __len__(self) -> int:
+        return self._size
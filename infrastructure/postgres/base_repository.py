@@ -1,13 +1,47 @@
 # infrastructure/postgres/base_repository.py
-from typing import TypeVar, Generic, List, Optional, Type, Any
+from functools import lru_cache
+from typing import TypeVar, Generic, List, Optional, Type, Any, AsyncIterator, Callable, Mapping, Sequence, get_args
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete, update
-from pydantic import BaseModel
+from sqlalchemy import bindparam, delete, insert, update
+from pydantic import BaseModel, TypeAdapter
 
 T = TypeVar('T', bound=BaseModel)
 M = TypeVar('M')  # SQLAlchemy model type
 
+@lru_cache(maxsize=None)
+def _list_adapter(domain_model: Type[BaseModel]) -> TypeAdapter:
+    """One List[domain_model] validator per model, built once and shared by every repository."""
+    return TypeAdapter(List[domain_model])
+
+def _has_nested_models(annotation: Any) -> bool:
+    """Whether a field annotation refers to a pydantic model, e.g. List[ReviewDomain]."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_has_nested_models(arg) for arg in get_args(annotation))
+
+@lru_cache(maxsize=None)
+def _orm_converter(domain_model: Type[BaseModel]) -> Callable[[Any], BaseModel]:
+    """
+    Generate a converter that copies an ORM instance's attributes straight into
+    domain_model.model_construct, skipping validation: rows read back from the
+    database already satisfy the schema's constraints. Built once per domain model.
+    Models with nested models fall back to model_validate, since model_construct
+    would keep the related ORM instances as they are.
+    """
+    if any(_has_nested_models(field.annotation) for field in domain_model.model_fields.values()):
+        return domain_model.model_validate
+    
+    fields = ", ".join(f"{name}=m.{name}" for name in domain_model.model_fields)
+    namespace = {"D": domain_model}
+    exec(f"def convert(m):\n    return D.model_construct({fields})", namespace)
+    return namespace["convert"]
+
+@lru_cache(maxsize=None)
+def _get_by_id_query(model: type):
+    """The get_by_id SELECT for a model, built once with the ID as a bound parameter."""
+    return select(model).where(model.id == bindparam("id"))
+
 class BasePostgresRepository(Generic[T, M]):
     """Base repository implementation with common CRUD operations."""
     
@@ -15,79 +49,93 @@ class BasePostgresRepository(Generic[T, M]):
         self.session = session
         self.model = model
         self.domain_model = domain_model
+        self._convert = _orm_converter(domain_model)
     
     def _to_domain(self, db_model: Optional[M]) -> Optional[T]:
         """Convert a database model to a domain model."""
-        if db_model is None:
-            return None
-        return self.domain_model.from_orm(db_model)
-    
-    def _to_domain_list(self, db_models: List[M]) -> List[T]:
-        """Convert a list of database models to domain models."""
-        return [self._to_domain(model) for model in db_models]
-    
-    def _to_db_model(self, domain_model: T) -> M:
-        """Convert a domain model to a database model."""
-        data = domain_model.dict(exclude_unset=True)
-        if domain_model.id:
-            # Update existing model
-            instance = self.model(**data)
-            instance.id = domain_model.id
-            return instance
-        else:
-            # Create new model
-            if 'id' in data:
-                del data['id']  # Remove None id for new instances
-            return self.model(**data)
+        return None if db_model is None else self._convert(db_model)
+    
+    def _rows_to_domain_list(self, rows: Sequence[Mapping[str, Any]]) -> List[T]:
+        """Validate column rows (e.g. from result.mappings()) into domain models in a single call."""
+        return _list_adapter(self.domain_model).validate_python(rows)
+    
+    def _select_columns(self):
+        """SELECT the table's columns rather than ORM entities, for bulk list reads."""
+        return select(self.model.__table__)
+    
+    @staticmethod
+    def _dump_for_insert(domain_model: T) -> dict:
+        """Dump the set fields in a single pass, leaving out a missing ID so the database assigns one."""
+        return domain_model.model_dump(exclude_unset=True, exclude=None if domain_model.id else {'id'})
     
     async def get_by_id(self, id: int) -> Optional[T]:
         """Retrieve an entity by its ID."""
-        query = select(self.model).where(self.model.id == id)
-        result = await self.session.execute(query)
+        result = await self.session.execute(_get_by_id_query(self.model), {"id": id})
         db_model = result.scalars().first()
         return self._to_domain(db_model)
     
     
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
         """Retrieve all entities with pagination."""
-        query = select(self.model).offset(skip).limit(limit)
+        query = self._select_columns().offset(skip).limit(limit)
         result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return self._to_domain_list(db_models)
+        return self._rows_to_domain_list(result.mappings().all())
+    
+    async def iter_all(self, skip: int = 0, limit: int = 100, partition_size: int = 256) -> AsyncIterator[T]:
+        """
+        Stream entities with pagination through a server-side cursor, so only
+        partition_size rows are held in memory at a time.
+        """
+        query = self._select_columns().order_by(self.model.id).offset(skip).limit(limit)
+        result = await self.session.stream(query)
+        async for rows in result.mappings().partitions(partition_size):
+            for entity in self._rows_to_domain_list(rows):
+                yield entity
     
     async def create(self, entity: T) -> T:
         """Create a new entity."""
-        db_model = self._to_db_model(entity)
-        self.session.add(db_model)
+        created = await self._insert_returning(entity)
         await self.session.commit()
-        await self.session.refresh(db_model)
-        return self._to_domain(db_model)
+        return created
     
     async def update(self, entity: T) -> T:
         """Update an existing entity."""
+        updated = await self._update_returning(entity)
+        await self.session.commit()
+        return updated
+    
+    async def _insert_returning(self, entity: T) -> T:
+        """INSERT the entity and read back the stored row in the same round-trip, without committing."""
+        data = self._dump_for_insert(entity)
+        query = insert(self.model).values(**data).returning(*self.model.__table__.columns)
+        result = await self.session.execute(query)
+        return self.domain_model.model_validate(result.mappings().one())
+    
+    async def _update_returning(self, entity: T) -> T:
+        """UPDATE the entity's row and read it back in the same round-trip, without committing."""
         if not entity.id:
             raise ValueError("Cannot update entity without ID")
         
-        # First, get the existing entity from the database
-        query = select(self.model).where(self.model.id == entity.id)
-        result = await self.session.execute(query)
-        db_model = result.scalars().first()
+        values = entity.model_dump(exclude_unset=True, exclude={'id'})
+        if not values:
+            # Nothing to SET; just confirm the row exists
+            existing = await self.get_by_id(entity.id)
+            if existing is None:
+                raise ValueError(f"Entity with ID {entity.id} not found")
+            return existing
         
-        if not db_model:
+        query = (
+            update(self.model)
+            .where(self.model.id == entity.id)
+            .values(**values)
+            .returning(*self.model.__table__.columns)
+        )
+        result = await self.session.execute(query)
+        row = result.mappings().one_or_none()
+        if row is None:
             raise ValueError(f"Entity with ID {entity.id} not found")
-        
-        # Update the model with new values
-        entity_data = entity.dict(exclude_unset=True)
-        for key, value in entity_data.items():
-            if hasattr(db_model, key):
-                setattr(db_model, key, value)
-        
-        # Commit the changes
-        await self.session.commit()
-        await self.session.refresh(db_model)
-        
-        return self._to_domain(db_model)
-
+        return self.domain_model.model_validate(row)
+    
     
     async def delete(self, id: int) -> bool:
         """Delete an entity by its ID."""
@@ -95,3 +143,10 @@ class BasePostgresRepository(Generic[T, M]):
         result = await self.session.execute(query)
         await self.session.commit()
         return result.rowcount > 0
+    
+    async def release_connection(self) -> None:
+        """
+        End the session's current transaction so its connection goes back to the pool.
+        The session stays usable; the next statement checks out a connection again.
+        """
+        await self.session.commit()
@@ -1,18 +1,84 @@
 # infrastructure/postgres/book_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from domain.models import BookDomain
+from sqlalchemy import Float, bindparam, delete, exists, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from domain.models import BookDomain, BookWithReviews
 from domain.repositories import BookRepositoryProtocol
-from .models import Book
+from .models import Book, BookRatingStats, Review
 from .base_repository import BasePostgresRepository
 
+# Hot-path statements are built once at import; values are supplied as bound parameters
+_EXISTS_QUERY = select(exists().where(Book.id == bindparam("id")))
+
+# Bayesian prior for recommendation scores: books are treated as having this
+# many extra reviews at this rating
+RECOMMENDATION_PRIOR_RATING = 3.0
+RECOMMENDATION_PRIOR_WEIGHT = 5
+
 class PostgresBookRepository(BasePostgresRepository[BookDomain, Book], BookRepositoryProtocol):
     """PostgreSQL implementation of the Book repository."""
     
     def __init__(self, session: AsyncSession):
         super().__init__(session, Book, BookDomain)
     
+    async def create(self, entity: BookDomain) -> BookDomain:
+        """Create a new book, translating a title/author clash into a ValueError."""
+        try:
+            return await super().create(entity)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ValueError("Book with this title and author already exists") from e
+    
+    async def update(self, entity: BookDomain) -> BookDomain:
+        """Update a book, translating a title/author clash into a ValueError."""
+        try:
+            return await super().update(entity)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ValueError("Another book with this title and author already exists") from e
+    
+    async def exists(self, id: int) -> bool:
+        """Check whether a book with the given ID exists."""
+        result = await self.session.execute(_EXISTS_QUERY, {"id": id})
+        return result.scalar()
+    
+    async def get_with_rating(self, id: int) -> Optional[Tuple[BookDomain, float, int]]:
+        """Get a book with its average rating and review count in one query, joined to its stats row."""
+        stats = BookRatingStats
+        query = (
+            select(*self.model.__table__.columns, stats.rating_sum, stats.review_count)
+            .outerjoin(stats, stats.book_id == self.model.id)
+            .where(self.model.id == id)
+        )
+        result = await self.session.execute(query)
+        row = result.mappings().first()
+        if row is None:
+            return None
+        
+        review_count = row["review_count"] or 0
+        average_rating = row["rating_sum"] / review_count if review_count else 0.0
+        return self.domain_model.model_validate(row), average_rating, review_count
+    
+    async def get_with_reviews(self, id: int) -> Optional[BookWithReviews]:
+        """Get a book with its reviews, loaded with a single extra IN query."""
+        query = select(self.model).options(selectinload(self.model.reviews)).where(self.model.id == id)
+        result = await self.session.execute(query)
+        db_model = result.scalars().first()
+        if db_model is None:
+            return None
+        return BookWithReviews.model_validate(db_model)
+    
+    async def delete_and_return(self, id: int) -> Optional[BookDomain]:
+        """Delete a book and return its columns in the same round-trip (DELETE ... RETURNING)."""
+        query = delete(self.model).where(self.model.id == id).returning(self.model)
+        result = await self.session.execute(query)
+        db_model = result.scalar_one_or_none()
+        await self.session.commit()
+        return self._to_domain(db_model)
+    
     async def get_by_title_and_author(self, title: str, author: str) -> Optional[BookDomain]:
         """Get a book by its title and author."""
         query = select(self.model).where(self.model.title == title, self.model.author == author)
@@ -22,13 +88,51 @@ class PostgresBookRepository(BasePostgresRepository[BookDomain, Book], BookRepos
     
     async def get_by_genre(self, genre: str) -> List[BookDomain]:
         """Get all books of a specific genre."""
-        query = select(self.model).where(self.model.genre == genre)
+        query = self._select_columns().where(self.model.genre == genre)
         result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return self._to_domain_list(db_models)
+        return self._rows_to_domain_list(result.mappings().all())
     
     async def get_by_year(self, year: int) -> List[BookDomain]:
         """Get all books published in a specific year."""
-        query = select(self.model).where(self.model.year_published == year)
+        query = self._select_columns().where(self.model.year_published == year)
+        result = await self.session.execute(query)
+        return self._rows_to_domain_list(result.mappings().all())
+    
+    async def get_popular_in_user_genres(self, user_id: int, limit: int = 20) -> List[Tuple[BookDomain, float, int]]:
+        """Get the best-rated books in a user's reviewed genres that they haven't reviewed yet, with their rating stats."""
+        user_genres = (
+            select(self.model.genre)
+            .join(Review, Review.book_id == self.model.id)
+            .where(Review.user_id == user_id, self.model.genre.is_not(None))
+            .distinct()
+        )
+        already_reviewed = exists().where(Review.user_id == user_id, Review.book_id == self.model.id)
+        # Ratings come from the maintained stats rows, not a GROUP BY over every review
+        stats = BookRatingStats
+        review_count = func.coalesce(stats.review_count, 0)
+        # Typed as Float so the division stays double precision instead of NUMERIC
+        average_rating = (stats.rating_sum / func.nullif(stats.review_count, 0, type_=Float)).label("average_rating")
+        # Bayesian average, so a single 5-star review doesn't outrank a well-reviewed book
+        score = (
+            (func.coalesce(stats.rating_sum, 0.0) + RECOMMENDATION_PRIOR_RATING * RECOMMENDATION_PRIOR_WEIGHT)
+            / (review_count + RECOMMENDATION_PRIOR_WEIGHT)
+        )
+        query = (
+            select(
+                *self.model.__table__.columns,
+                average_rating,
+                review_count.label("review_count"),
+            )
+            .outerjoin(stats, stats.book_id == self.model.id)
+            .where(self.model.genre.in_(user_genres), ~already_reviewed)
+            .order_by(score.desc(), self.model.id)
+            .limit(limit)
+        )
         result = await self.session.execute(query)
-        db_models = result.scalars().all
+        rows = result.mappings().all()
+        # The aggregate columns are ignored by BookDomain validation
+        books = self._rows_to_domain_list(rows)
+        return [
+            (book, row["average_rating"] or 0.0, row["review_count"])
+            for book, row in zip(books, rows)
+        ]
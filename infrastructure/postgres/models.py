@@ -21,18 +21,22 @@ class Book(Base):
     summary = Column(Text, nullable=True, comment="Synopsis or summary of the book (can be AI-generated)")
 
     # --- Relationships ---
+    # Reviews are never loaded implicitly; queries that need them opt in with
+    # selectinload(Book.reviews), so plain book reads don't pull every review along
     reviews = relationship(
         "Review",
         back_populates="book",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        lazy="selectin"
+        lazy="raise"
     )
 
     # --- Constraints and Indexes ---
     __table_args__ = (
         UniqueConstraint('title', 'author', name='uq_book_title_author'),
         Index('ix_book_genre_year', 'genre', 'year_published'),
+        # The (genre, year) index can't serve year-only lookups
+        Index('ix_books_year', 'year_published'),
         {'comment': 'Stores information about books in the library'}
     )
 
@@ -49,25 +53,58 @@ class Review(Base):
 
     # --- Columns ---
     id = Column(Integer, primary_key=True, index=True, comment="Unique identifier for the review")
-    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True, comment="Foreign key referencing the reviewed book")
+    # Indexed by ix_review_book_id_id below, which also serves plain book_id lookups
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, comment="Foreign key referencing the reviewed book")
     user_id = Column(Integer, index=True, nullable=False, comment="Identifier for the user who wrote the review (assuming external user system)")
     review_text = Column(Text, nullable=True, comment="The text content of the review")
     rating = Column(Float, nullable=False, comment="User's rating for the book (e.g., 0.0 to 5.0)")
 
     # --- Relationships ---
+    # Review reads never need the book's columns, so they aren't joined in implicitly;
+    # callers that do need them opt in with selectinload(Review.book)
     book = relationship(
         "Book",
         back_populates="reviews",
-        lazy="joined"
+        lazy="raise"
     )
 
     # --- Constraints and Indexes ---
     __table_args__ = (
         CheckConstraint('rating >= 0 AND rating <= 5', name='chk_review_rating_range'),
-        Index('ix_review_user_id', 'user_id'),
+        # Matches get_by_book_id's WHERE book_id ... ORDER BY id pagination, and covers
+        # rating so per-book aggregates (stats recomputes) are index-only scans
+        Index('ix_review_book_id_id', 'book_id', 'id', postgresql_include=['rating']),
         {'comment': 'Stores user reviews and ratings for books'}
     )
 
     def __repr__(self):
         """String representation for debugging."""
         return f"<Review(id={self.id}, book_id={self.book_id}, user_id={self.user_id}, rating={self.rating})>"
+
+
+class BookRatingStats(Base):
+    """
+    SQLAlchemy ORM model for the 'book_rating_stats' table.
+    Rating aggregates per book, maintained by the review repository in the same
+    transaction as each review write, so reads are a single primary-key lookup.
+    """
+    __tablename__ = "book_rating_stats"
+
+    # --- Columns ---
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True, comment="Book the aggregates belong to")
+    review_count = Column(Integer, nullable=False, default=0, server_default="0", comment="Number of reviews for the book")
+    rating_sum = Column(Float, nullable=False, default=0.0, server_default="0", comment="Sum of all review ratings for the book")
+    # Ratings are bucketed to the nearest star; anything below 1.5 counts as 1 star
+    rating_1 = Column(Integer, nullable=False, default=0, server_default="0", comment="Number of 1-star reviews")
+    rating_2 = Column(Integer, nullable=False, default=0, server_default="0", comment="Number of 2-star reviews")
+    rating_3 = Column(Integer, nullable=False, default=0, server_default="0", comment="Number of 3-star reviews")
+    rating_4 = Column(Integer, nullable=False, default=0, server_default="0", comment="Number of 4-star reviews")
+    rating_5 = Column(Integer, nullable=False, default=0, server_default="0", comment="Number of 5-star reviews")
+
+    __table_args__ = (
+        {'comment': 'Incrementally maintained rating aggregates per book'},
+    )
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f"<BookRatingStats(book_id={self.book_id}, review_count={self.review_count}, rating_sum={self.rating_sum})>"
@@ -1,36 +1,204 @@
 # infrastructure/postgres/review_repository.py
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import bindparam, delete, func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from domain.models import ReviewDomain
 from domain.repositories import ReviewRepositoryProtocol
-from .models import Review
+from .models import Book, BookRatingStats, Review
 from .base_repository import BasePostgresRepository
 
+# Hot-path statements are built once at import; values are supplied as bound parameters.
+# A stable order keeps OFFSET pages from overlapping.
+_BY_BOOK_ID_QUERY = (
+    select(Review.__table__)
+    .where(Review.book_id == bindparam("book_id"))
+    .order_by(Review.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
 class PostgresReviewRepository(BasePostgresRepository[ReviewDomain, Review], ReviewRepositoryProtocol):
     """PostgreSQL implementation of the Review repository."""
     
     def __init__(self, session: AsyncSession):
         super().__init__(session, Review, ReviewDomain)
     
-    async def get_by_book_id(self, book_id: int) -> List[ReviewDomain]:
-        """Get all reviews for a specific book."""
-        query = select(self.model).where(self.model.book_id == book_id)
+    async def get_by_book_id(self, book_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
+        """Get reviews for a specific book with pagination."""
+        result = await self.session.execute(
+            _BY_BOOK_ID_QUERY, {"book_id": book_id, "skip": skip, "limit": limit}
+        )
+        return self._rows_to_domain_list(result.mappings().all())
+    
+    async def iter_by_book_id(self, book_id: int, batch_size: int = 500) -> AsyncIterator[ReviewDomain]:
+        """
+        Stream all reviews for a specific book through a server-side cursor,
+        fetching and validating batch_size rows at a time.
+        """
+        query = (
+            self._select_columns()
+            .where(self.model.book_id == book_id)
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for rows in result.mappings().partitions():
+            for review in self._rows_to_domain_list(rows):
+                yield review
+    
+    async def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100) -> List[ReviewDomain]:
+        """Get reviews by a specific user with pagination."""
+        query = (
+            self._select_columns()
+            .where(self.model.user_id == user_id)
+            .order_by(self.model.id)
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return self._to_domain_list(db_models)
+        return self._rows_to_domain_list(result.mappings().all())
     
-    async def get_by_user_id(self, user_id: int) -> List[ReviewDomain]:
-        """Get all reviews by a specific user."""
-        query = select(self.model).where(self.model.user_id == user_id)
+    async def create(self, entity: ReviewDomain) -> ReviewDomain:
+        """
+        Create a new review and fold its rating into the book's stats in the same transaction.
+        The books foreign key doubles as the existence check: a review for a missing
+        book raises ValueError instead of needing a separate SELECT first.
+        """
+        try:
+            created_review = await self._insert_returning(entity)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ValueError(f"Book with ID {entity.book_id} does not exist") from e
+        await self.session.execute(self._increment_stats(created_review.book_id, created_review.rating))
+        await self.session.commit()
+        return created_review
+    
+    async def update(self, entity: ReviewDomain) -> ReviewDomain:
+        """Update an existing review and recompute the stats of the affected book(s)."""
+        previous_book_id = await self._get_book_id(entity.id)
+        updated_review = await self._update_returning(entity)
+        book_ids = sorted({previous_book_id, updated_review.book_id} - {None})
+        await self._lock_stats(book_ids)
+        for book_id in book_ids:
+            await self.session.execute(self._recompute_stats(book_id))
+        await self.session.commit()
+        return updated_review
+    
+    async def delete(self, id: int) -> bool:
+        """Delete a review by its ID and recompute its book's stats."""
+        query = delete(self.model).where(self.model.id == id).returning(self.model.book_id)
         result = await self.session.execute(query)
-        db_models = result.scalars().all()
-        return self._to_domain_list(db_models)
+        book_id = result.scalar_one_or_none()
+        if book_id is not None:
+            await self._lock_stats([book_id])
+            await self.session.execute(self._recompute_stats(book_id))
+        await self.session.commit()
+        return book_id is not None
     
     async def get_average_rating_for_book(self, book_id: int) -> float:
-        """Get the average rating for a specific book."""
-        query = select(func.avg(self.model.rating)).where(self.model.book_id == book_id)
+        """Get the average rating for a specific book from its maintained stats row."""
+        query = (
+            select(BookRatingStats.rating_sum / func.nullif(BookRatingStats.review_count, 0))
+            .where(BookRatingStats.book_id == book_id)
+        )
         result = await self.session.execute(query)
         avg_rating = result.scalar()
         return avg_rating or 0.0
+    
+    async def get_rating_statistics(self, book_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the review count, average rating and rating distribution from the book's stats row.
+        Books are LEFT JOINed to their stats, so a missing book yields no row (None)
+        while a book that has never been reviewed yields zero counts.
+        """
+        stats = BookRatingStats
+        query = (
+            select(
+                stats.review_count, stats.rating_sum,
+                stats.rating_1, stats.rating_2, stats.rating_3, stats.rating_4, stats.rating_5,
+            )
+            .select_from(Book)
+            .outerjoin(stats, stats.book_id == Book.id)
+            .where(Book.id == book_id)
+        )
+        result = await self.session.execute(query)
+        row = result.first()
+        if row is None:
+            return None
+        
+        total_reviews, rating_sum, *distribution = (value or 0 for value in row)
+        return {
+            "total_reviews": total_reviews,
+            "average_rating": rating_sum / total_reviews if total_reviews else 0.0,
+            "rating_distribution": {
+                str(star): count for star, count in enumerate(distribution, start=1)
+            }
+        }
+    
+    async def _get_book_id(self, id: int) -> Optional[int]:
+        """Get the book a review belongs to."""
+        result = await self.session.execute(select(self.model.book_id).where(self.model.id == id))
+        return result.scalar_one_or_none()
+    
+    async def _lock_stats(self, book_ids: List[int]) -> None:
+        """
+        Lock the stats rows of the given books, in book_id order, before recomputing them.
+        A recompute reads its reviews in one statement and writes the row in the next, so
+        an increment committed in between would otherwise be overwritten; once the lock is
+        held, later statements see every review folded in by earlier increments, and new
+        increments wait for this transaction.
+        """
+        query = (
+            select(BookRatingStats.book_id)
+            .where(BookRatingStats.book_id.in_(book_ids))
+            .order_by(BookRatingStats.book_id)
+            .with_for_update()
+        )
+        await self.session.execute(query)
+    
+    @staticmethod
+    def _increment_stats(book_id: int, rating: float):
+        """Build an upsert that adds one rating to a book's stats row."""
+        # Same buckets as the SQL round() used by _recompute_stats (ties round to even)
+        bucket = f"rating_{min(5, max(1, round(rating)))}"
+        stats = BookRatingStats.__table__
+        return (
+            insert(stats)
+            .values(book_id=book_id, review_count=1, rating_sum=rating, **{bucket: 1})
+            .on_conflict_do_update(
+                index_elements=[stats.c.book_id],
+                set_={
+                    "review_count": stats.c.review_count + 1,
+                    "rating_sum": stats.c.rating_sum + rating,
+                    bucket: stats.c[bucket] + 1,
+                },
+            )
+        )
+    
+    @staticmethod
+    def _recompute_stats(book_id: int):
+        """Build an upsert that rebuilds a book's stats row from its reviews."""
+        rounded_rating = func.round(Review.rating)
+        aggregates = (
+            select(
+                literal(book_id),
+                func.count(Review.id),
+                func.coalesce(func.sum(Review.rating), 0.0),
+                func.count(Review.id).filter(rounded_rating <= 1),
+                func.count(Review.id).filter(rounded_rating == 2),
+                func.count(Review.id).filter(rounded_rating == 3),
+                func.count(Review.id).filter(rounded_rating == 4),
+                func.count(Review.id).filter(rounded_rating >= 5),
+            )
+            .where(Review.book_id == book_id)
+        )
+        stats = BookRatingStats.__table__
+        columns = ["book_id", "review_count", "rating_sum", "rating_1", "rating_2", "rating_3", "rating_4", "rating_5"]
+        query = insert(stats).from_select(columns, aggregates)
+        return query.on_conflict_do_update(
+            index_elements=[stats.c.book_id],
+            set_={column: query.excluded[column] for column in columns[1:]},
+        )
@@ -2,12 +2,29 @@
 # Main FastAPI application file
 
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from infrastructure import close_ollama_client, close_redis
+from logging_config import start_logging, stop_logging
 
 # Import the router
 from router import router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Log records are handed to a background thread so emitting never blocks the event loop
+    start_logging()
+    yield
+    await close_ollama_client()
+    await close_redis()
+    stop_logging()
+
 app = FastAPI(
+    lifespan=lifespan,
+    # orjson encodes response bodies considerably faster than the stdlib json module
+    default_response_class=ORJSONResponse,
     title="Intelligent Book Management System",
     description="API for managing books and reviews, with AI-powered summaries and recommendations.",
     version="1.0.0",
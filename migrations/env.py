@@ -24,7 +24,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from database import Base
-from infrastructure.postgres.models import Book, Review
+from infrastructure.postgres.models import Book, Review, BookRatingStats
 
 target_metadata = Base.metadata
 
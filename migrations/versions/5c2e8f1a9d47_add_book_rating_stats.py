@@ -0,0 +1,58 @@
+"""Add book_rating_stats table with incrementally maintained rating aggregates
+
+Revision ID: 5c2e8f1a9d47
+Revises: ee976dd06518
+Create Date: 2026-10-14 11:02:17.540913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e8f1a9d47'
+down_revision: Union[str, None] = 'ee976dd06518'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('book_rating_stats',
+    sa.Column('book_id', sa.Integer(), nullable=False, comment='Book the aggregates belong to'),
+    sa.Column('review_count', sa.Integer(), server_default='0', nullable=False, comment='Number of reviews for the book'),
+    sa.Column('rating_sum', sa.Float(), server_default='0', nullable=False, comment='Sum of all review ratings for the book'),
+    sa.Column('rating_1', sa.Integer(), server_default='0', nullable=False, comment='Number of 1-star reviews'),
+    sa.Column('rating_2', sa.Integer(), server_default='0', nullable=False, comment='Number of 2-star reviews'),
+    sa.Column('rating_3', sa.Integer(), server_default='0', nullable=False, comment='Number of 3-star reviews'),
+    sa.Column('rating_4', sa.Integer(), server_default='0', nullable=False, comment='Number of 4-star reviews'),
+    sa.Column('rating_5', sa.Integer(), server_default='0', nullable=False, comment='Number of 5-star reviews'),
+    sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('book_id'),
+    comment='Incrementally maintained rating aggregates per book'
+    )
+    # Backfill from the existing reviews, using the same star buckets as the repository
+    op.execute(
+        """
+        INSERT INTO book_rating_stats
+            (book_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5)
+        SELECT
+            book_id,
+            count(*),
+            sum(rating),
+            count(*) FILTER (WHERE round(rating) <= 1),
+            count(*) FILTER (WHERE round(rating) = 2),
+            count(*) FILTER (WHERE round(rating) = 3),
+            count(*) FILTER (WHERE round(rating) = 4),
+            count(*) FILTER (WHERE round(rating) >= 5)
+        FROM reviews
+        GROUP BY book_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('book_rating_stats')
@@ -0,0 +1,35 @@
+"""Replace reviews.book_id index with a covering (book_id, id) INCLUDE (rating) index
+
+Revision ID: 9a4d6b3e7f21
+Revises: 5c2e8f1a9d47
+Create Date: 2026-10-14 12:20:05.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d6b3e7f21'
+down_revision: Union[str, None] = '5c2e8f1a9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_review_book_id_id', 'reviews', ['book_id', 'id'], unique=False,
+                        postgresql_include=['rating'], postgresql_concurrently=True)
+        # The composite index's leading column serves book_id-only lookups
+        op.drop_index('ix_reviews_book_id', table_name='reviews', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_reviews_book_id', 'reviews', ['book_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_review_book_id_id', table_name='reviews', postgresql_concurrently=True)
@@ -0,0 +1,34 @@
+"""Add year_published index and drop duplicate reviews.user_id index
+
+Revision ID: ee976dd06518
+Revises: 3aa36ca89275
+Create Date: 2026-10-14 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee976dd06518'
+down_revision: Union[str, None] = '3aa36ca89275'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_books_year', 'books', ['year_published'], unique=False, postgresql_concurrently=True)
+        # ix_reviews_user_id already covers user_id lookups
+        op.drop_index('ix_review_user_id', table_name='reviews', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_review_user_id', 'reviews', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_books_year', table_name='books', postgresql_concurrently=True)
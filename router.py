@@ -1,56 +1,123 @@
 # router.py
 # Router containing all endpoints from the main application
 
-from fastapi import APIRouter, HTTPException, Depends
+import logging
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 import schemas
 from database import get_db
+from http_cache import conditional_response
 
 # Import domain models and services
 from domain.models import BookDomain, ReviewDomain
+from domain.repositories import LlmRepositoryProtocol
 from domain.services import BookService, ReviewService, LlmService
 
 # Import application services
 from application import BookApplication, ReviewApplication
 
 # Import infrastructure implementations
-from infrastructure import PostgresBookRepository, PostgresReviewRepository, LlmRepository
+from infrastructure import (
+    PostgresBookRepository, PostgresReviewRepository, get_llm_repository,
+    get_redis, CachedBookService, CachedReviewService,
+    CachedLlmRepository, LLM_SEMANTIC_CACHE
+)
+
+logger = logging.getLogger(__name__)
 
 # Create the router with the same tags configuration
 router = APIRouter()
 
 # --- Dependencies for Application Services ---
-async def get_book_application(db: AsyncSession = Depends(get_db)):
-    """Dependency to get the BookApplication instance."""
-    # Create repositories
+# The semantic cache must outlive a request, so its repository is shared process-wide
+_cached_llm_repository = CachedLlmRepository(get_llm_repository()) if LLM_SEMANTIC_CACHE else None
+
+def build_llm_repository() -> LlmRepositoryProtocol:
+    """Return the process-wide LLM repository, wrapped in the semantic cache when it's enabled."""
+    if _cached_llm_repository is not None:
+        return _cached_llm_repository
+    return get_llm_repository()
+
+async def provide_llm_repository() -> LlmRepositoryProtocol:
+    """
+    Dependency for the shared LLM repository, so tests can override it.
+    Async so FastAPI doesn't dispatch it to the threadpool.
+    """
+    return build_llm_repository()
+
+def build_llm_service(llm_repo: LlmRepositoryProtocol) -> LlmService:
+    """Create an LlmService on top of the given LLM repository."""
+    return LlmService(llm_repo)
+
+def build_book_service(db: AsyncSession) -> BookService:
+    """Create a BookService, backed by the Redis cache when one is configured."""
     book_repo = PostgresBookRepository(db)
-    llm_repo = LlmRepository()
-    
+    redis = get_redis()
+    if redis is not None:
+        return CachedBookService(book_repo, redis)
+    return BookService(book_repo)
+
+def build_review_service(db: AsyncSession) -> ReviewService:
+    """Create a ReviewService, backed by the Redis cache when one is configured."""
+    review_repo = PostgresReviewRepository(db)
+    redis = get_redis()
+    if redis is not None:
+        return CachedReviewService(review_repo, redis)
+    return ReviewService(review_repo)
+
+async def get_book_application(
+    db: AsyncSession = Depends(get_db),
+    review_db: AsyncSession = Depends(get_db, use_cache=False),
+    llm_repo: LlmRepositoryProtocol = Depends(provide_llm_repository)
+):
+    """
+    Dependency to get the BookApplication instance.
+    Reviews get their own session because BookApplication queries books and
+    reviews concurrently, and an AsyncSession can't run two statements at once.
+    """
     # Create domain services
-    book_service = BookService(book_repo)
-    llm_service = LlmService(llm_repo)
-    review_service = ReviewService(PostgresReviewRepository(db))
+    book_service = build_book_service(db)
+    llm_service = build_llm_service(llm_repo)
+    review_service = build_review_service(review_db)
     
     # Create and return application service
     return BookApplication(book_service, review_service, llm_service)
 
-async def get_review_application(db: AsyncSession = Depends(get_db)):
+async def get_review_application(
+    db: AsyncSession = Depends(get_db),
+    llm_repo: LlmRepositoryProtocol = Depends(provide_llm_repository)
+):
     """Dependency to get the ReviewApplication instance."""
-    # Create repositories
-    review_repo = PostgresReviewRepository(db)
-    book_repo = PostgresBookRepository(db)
-    llm_repo = LlmRepository()
-    
     # Create domain services
-    review_service = ReviewService(review_repo)
-    book_service = BookService(book_repo)
-    llm_service = LlmService(llm_repo)
+    review_service = build_review_service(db)
+    book_service = build_book_service(db)
+    llm_service = build_llm_service(llm_repo)
     
     # Create and return application service
     return ReviewApplication(review_service, book_service, llm_service)
 
+async def _json_array(first_item, items: AsyncIterator, schema) -> AsyncIterator[bytes]:
+    """Encode an already-started async stream of domain models as a JSON array, one element at a time."""
+    yield b"[" + schema.model_validate(first_item).model_dump_json().encode()
+    async for item in items:
+        yield b"," + schema.model_validate(item).model_dump_json().encode()
+    yield b"]"
+
+async def _streaming_json_array(items: AsyncIterator, schema) -> Response:
+    """
+    Stream an async iterator of domain models as a JSON array. The first item is
+    fetched before the response starts, so a failing query still becomes a proper
+    error response instead of a 200 with a truncated body.
+    """
+    try:
+        first_item = await anext(items)
+    except StopAsyncIteration:
+        return Response(b"[]", media_type="application/json")
+    return StreamingResponse(_json_array(first_item, items, schema), media_type="application/json")
+
 # === Book Endpoints ===
 
 @router.post("/books", response_model=schemas.Book, status_code=201, tags=["Books"],
@@ -81,7 +148,7 @@ async def create_book(
         created_book = await app.create_book(book_domain, generate_summary)
         
         # Convert back to response schema
-        return schemas.Book.from_orm(created_book)
+        return schemas.Book.model_validate(created_book)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -105,8 +172,8 @@ async def read_books(
     if limit > 1000:  # Add a reasonable upper limit
         limit = 1000
     
-    books = await app.get_books(skip, limit)
-    return [schemas.Book.from_orm(book) for book in books]
+    # Stream the JSON array as rows arrive, so at most one cursor partition is in memory
+    return await _streaming_json_array(app.iter_books(skip, limit), schemas.Book)
 
 
 @router.get("/books/{book_id}", response_model=schemas.Book, tags=["Books"],
@@ -114,6 +181,7 @@ async def read_books(
           description="Gets detailed information for a single book identified by its unique `book_id`.")
 async def read_book(
     book_id: int, 
+    request: Request,
     app: BookApplication = Depends(get_book_application)
 ):
     """
@@ -125,7 +193,7 @@ async def read_book(
     if book is None:
         raise HTTPException(status_code=404, detail=f"Book with ID {book_id} not found")
     
-    return schemas.Book.from_orm(book)
+    return conditional_response(request, schemas.Book.model_validate(book))
 
 
 @router.put("/books/{book_id}", response_model=schemas.Book, tags=["Books"],
@@ -144,14 +212,14 @@ async def update_book(
     """
     try:
         # Convert schema to domain model with only the fields to update
-        book_update = BookDomain(id=book_id, **book_in.dict(exclude_unset=True))
+        book_update = BookDomain(id=book_id, **book_in.model_dump(exclude_unset=True))
         
         # Update the book
         updated_book = await app.update_book(book_id, book_update)
         if updated_book is None:
             raise HTTPException(status_code=404, detail=f"Book with ID {book_id} not found")
         
-        return schemas.Book.from_orm(updated_book)
+        return schemas.Book.model_validate(updated_book)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -172,7 +240,7 @@ async def delete_book(
     if deleted_book is None:
         raise HTTPException(status_code=404, detail=f"Book with ID {book_id} not found")
     
-    return schemas.Book.from_orm(deleted_book)
+    return schemas.Book.model_validate(deleted_book)
 
 
 # === Review Endpoints ===
@@ -204,7 +272,7 @@ async def create_review_for_book(
     if created_review is None:
         raise HTTPException(status_code=404, detail=f"Cannot add review: Book with ID {book_id} not found")
     
-    return schemas.Review.from_orm(created_review)
+    return schemas.Review.model_validate(created_review)
 
 
 @router.get("/books/{book_id}/reviews", response_model=List[schemas.Review], tags=["Reviews"],
@@ -227,14 +295,11 @@ async def read_reviews_for_book(
         limit = 1000
     
     reviews = await app.get_book_reviews(book_id, skip, limit)
-    if not reviews and book_id:
-        # Check if the book exists
-        book_app = await get_book_application(next(get_db()))
-        book = await book_app.get_book(book_id)
-        if book is None:
-            raise HTTPException(status_code=404, detail=f"Book with ID {book_id} not found")
+    # Only an empty page needs the EXISTS probe to tell "no reviews" from "no book"
+    if not reviews and not await app.book_exists(book_id):
+        raise HTTPException(status_code=404, detail=f"Book with ID {book_id} not found")
     
-    return [schemas.Review.from_orm(review) for review in reviews]
+    return [schemas.Review.model_validate(review) for review in reviews]
 
 
 # === AI Feature Endpoints ===
@@ -244,46 +309,45 @@ async def read_reviews_for_book(
           description="Retrieves the book's stored summary and calculates its average rating based on all submitted reviews.")
 async def get_book_summary_and_rating(
     book_id: int, 
-    book_app: BookApplication = Depends(get_book_application),
-    review_app: ReviewApplication = Depends(get_review_application)
+    request: Request,
+    book_app: BookApplication = Depends(get_book_application)
 ):
     """
     Gets a book's stored summary and calculates its average rating from reviews.
 
     - **book_id**: The ID of the book.
     """
-    # Get the book
-    book = await book_app.get_book(book_id)
-    if book is None:
+    # Book and rating are fetched in a single query
+    result = await book_app.get_book_summary_and_rating(book_id)
+    if result is None:
         raise HTTPException(status_code=404, detail=f"Book with ID {book_id} not found")
-    
-    # Get the average rating
-    average_rating = await review_app.get_average_rating(book_id)
+    summary, average_rating = result
     
     # Format the rating nicely (e.g., 2 decimal places) if it exists
     formatted_rating = round(average_rating, 2) if average_rating is not None else None
     
-    return schemas.BookSummary(
-        summary=book.summary,
+    # The ETag covers the summary and rating, so it changes whenever either does
+    return conditional_response(request, schemas.BookSummary(
+        summary=summary,
         average_rating=formatted_rating
-    )
+    ))
 
 
 @router.get("/recommendations", response_model=List[schemas.Book], tags=["AI Features"],
-         summary="Get book recommendations (Placeholder)",
-         description="Provides book recommendations based on user preferences. **Note: This endpoint currently returns a simple list of recent books and requires actual recommendation logic implementation.**")
+         summary="Get book recommendations",
+         description="Recommends the best-rated books in the genres the user has reviewed, ranked by a Bayesian average rating so books with only a few reviews don't dominate. Books the user already reviewed are excluded; users without enough history are topped up with the latest books.")
 async def get_recommendations(
     user_id: int, 
     app: BookApplication = Depends(get_book_application)
 ):
     """
-    Gets book recommendations for a specific user.
-    **Requires implementation of actual recommendation logic.**
+    Gets book recommendations for a specific user, based on the genres they have
+    reviewed and a Bayesian average of each candidate's ratings.
 
     - **user_id**: The ID of the user for whom to get recommendations.
     """
     recommended_books = await app.get_recommendations(user_id)
-    return [schemas.Book.from_orm(book) for book in recommended_books]
+    return [schemas.Book.model_validate(book) for book in recommended_books]
 
 
 @router.post("/generate-summary", response_model=schemas.GeneratedSummary, tags=["AI Features"],
@@ -307,7 +371,7 @@ async def generate_summary_endpoint(
         return schemas.GeneratedSummary(generated_summary=summary)
     except Exception as e:
         # Catch potential errors from the LLM interaction
-        print(f"Error in /generate-summary endpoint: {e}")
+        logger.exception("Error in /generate-summary endpoint")
         raise HTTPException(status_code=500, detail=f"Failed to generate summary due to an internal error: {str(e)}")
 
 
@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from application.book_application import BookApplication
+from domain.models import BookDomain
+from domain.services import BookService, LlmService
+from tests.fakes import FakeBookRepository, FakeLlmRepository
+
+class TestCreateBook:
+    @pytest.fixture
+    def book_repository(self):
+        """Create a fake repository holding a single book."""
+        return FakeBookRepository([BookDomain(id=1, title="Dune", author="Frank Herbert", genre="Sci-Fi")])
+    
+    @pytest.fixture
+    def llm_repository(self):
+        """Create a fake LLM repository."""
+        return FakeLlmRepository()
+    
+    def make_app(self, book_repository, llm_repository):
+        return BookApplication(BookService(book_repository), review_service=None, llm_service=LlmService(llm_repository))
+    
+    def created(self, book_repository):
+        return [call[1] for call in book_repository.calls if call[0] == "create"]
+    
+    async def test_generates_summary_before_single_insert(self, book_repository, llm_repository):
+        """Test that the generated summary is written by the one INSERT."""
+        app = self.make_app(book_repository, llm_repository)
+        
+        book = await app.create_book(BookDomain(title="Emma", author="Jane Austen", genre="Romance"), generate_summary=True)
+        
+        assert book.id == 2
+        assert book.summary == "This is a generated book summary."
+        assert llm_repository.calls == [("generate_book_summary", "Emma", "'Emma' by Jane Austen. Genre: Romance.")]
+        assert [created.summary for created in self.created(book_repository)] == [book.summary]
+        assert ("release_connection",) in book_repository.calls
+    
+    async def test_duplicate_cancels_generation(self, book_repository):
+        """Test that a duplicate raises ValueError and cancels the summary still being generated."""
+        cancelled = asyncio.Event()
+        
+        class StallingLlmRepository(FakeLlmRepository):
+            async def generate_book_summary(self, book_title, book_content):
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+        app = self.make_app(book_repository, StallingLlmRepository())
+        
+        with pytest.raises(ValueError, match="already exists"):
+            await asyncio.wait_for(
+                app.create_book(BookDomain(title="Dune", author="Frank Herbert"), generate_summary=True), timeout=1
+            )
+        
+        assert cancelled.is_set()
+        assert self.created(book_repository) == []
+    
+    async def test_probe_error_is_not_wrapped(self, book_repository, llm_repository):
+        """Test that a failing duplicate probe raises its own exception rather than an ExceptionGroup."""
+        async def failing_probe(title, author):
+            raise ConnectionError("database unavailable")
+        book_repository.get_by_title_and_author = failing_probe
+        app = self.make_app(book_repository, llm_repository)
+        
+        with pytest.raises(ConnectionError):
+            await app.create_book(BookDomain(title="Emma", author="Jane Austen"), generate_summary=True)
+        
+        assert self.created(book_repository) == []
+    
+    async def test_llm_failure_still_creates_book(self, book_repository, llm_repository):
+        """Test that a failed summary generation still inserts the book, without a summary."""
+        llm_repository.error = RuntimeError("AI book summary generation failed.")
+        app = self.make_app(book_repository, llm_repository)
+        
+        book = await app.create_book(BookDomain(title="Emma", author="Jane Austen"), generate_summary=True)
+        
+        assert book.summary is None
+        assert len(self.created(book_repository)) == 1
+        assert book_repository.books[book.id].title == "Emma"
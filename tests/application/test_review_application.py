@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from application.review_application import ReviewApplication
+from domain.models import BookDomain, ReviewDomain
+from domain.services import BookService, LlmService, ReviewService
+from tests.fakes import FakeBookRepository, FakeLlmRepository, FakeReviewRepository
+
+PARTIAL_SUMMARY = "This is a generated review summary."
+
+def make_reviews(*texts, book_id=1):
+    return [
+        ReviewDomain(id=index, book_id=book_id, user_id=index, review_text=text, rating=4.0)
+        for index, text in enumerate(texts, start=1)
+    ]
+
+class TestSummarizeBookReviews:
+    @pytest.fixture
+    def book_repository(self):
+        """Create a fake repository holding a single book."""
+        return FakeBookRepository([BookDomain(id=1, title="Dune", author="Frank Herbert")])
+    
+    @pytest.fixture
+    def llm_repository(self):
+        """Create a fake LLM repository."""
+        return FakeLlmRepository()
+    
+    def make_app(self, book_repository, llm_repository, reviews):
+        return ReviewApplication(
+            ReviewService(FakeReviewRepository(reviews)),
+            BookService(book_repository),
+            LlmService(llm_repository),
+            review_chunk_size=2,
+        )
+    
+    async def test_missing_book(self, book_repository, llm_repository):
+        """Test that a missing book yields None without calling the LLM."""
+        app = self.make_app(book_repository, llm_repository, [])
+        
+        assert await app.summarize_book_reviews(2) is None
+        assert llm_repository.calls == []
+    
+    async def test_no_reviews(self, book_repository, llm_repository):
+        """Test that a book without reviews gets a fixed message without calling the LLM."""
+        app = self.make_app(book_repository, llm_repository, [])
+        
+        assert await app.summarize_book_reviews(1) == "No reviews available for this book."
+        assert llm_repository.calls == []
+    
+    async def test_single_chunk_skips_reduce(self, book_repository, llm_repository):
+        """Test that exactly one full chunk is summarized once, with no reduce step."""
+        app = self.make_app(book_repository, llm_repository, make_reviews("Great", "Slow start"))
+        
+        summary = await app.summarize_book_reviews(1)
+        
+        assert summary == PARTIAL_SUMMARY
+        assert llm_repository.calls == [("generate_review_summary", ["Great", "Slow start"])]
+    
+    async def test_several_chunks_are_reduced(self, book_repository, llm_repository):
+        """Test that each chunk is summarized and the partial summaries are reduced."""
+        app = self.make_app(book_repository, llm_repository, make_reviews("A", "B", "C", "D", "E"))
+        
+        summary = await app.summarize_book_reviews(1)
+        
+        assert summary == PARTIAL_SUMMARY
+        assert sorted(reviews for _, reviews in llm_repository.calls[:3]) == [["A", "B"], ["C", "D"], ["E"]]
+        assert llm_repository.calls[3:] == [("generate_review_summary", [PARTIAL_SUMMARY] * 3)]
+    
+    async def test_failing_chunk_cancels_siblings(self, book_repository):
+        """Test that a failing chunk propagates its error and cancels the chunks still running."""
+        cancelled = []
+        
+        class StallingLlmRepository(FakeLlmRepository):
+            async def generate_review_summary(self, reviews):
+                if reviews[0] == "Fail":
+                    raise RuntimeError("AI review summary generation failed.")
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(reviews)
+                    raise
+        app = self.make_app(book_repository, StallingLlmRepository(), make_reviews("A", "B", "Fail", "C", "D", "E"))
+        
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(app.summarize_book_reviews(1), timeout=1)
+        await asyncio.sleep(0)
+        
+        assert sorted(cancelled) == [["A", "B"], ["D", "E"]]
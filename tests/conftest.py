@@ -0,0 +1,13 @@
+# tests/conftest.py
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the async tests on uvloop when it is installed."""
+    # A single factory; more than one would run every async test once per loop
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return None
@@ -0,0 +1,110 @@
+import asyncio
+import time
+import pytest
+from domain.batching import BatchQueue
+
+class TestBatchQueue:
+    @pytest.fixture
+    def calls(self):
+        """Record the batches passed to batch_fn."""
+        return []
+    
+    def make_queue(self, calls, batch_fn=None, **kwargs):
+        async def echo(items):
+            calls.append(list(items))
+            return [item * 10 for item in items]
+        return BatchQueue(batch_fn or echo, **kwargs)
+    
+    async def test_flushes_when_batch_size_reached(self, calls):
+        """Test that a full batch is sent without waiting for the window."""
+        queue = self.make_queue(calls, batch_size=3, batch_window_ms=10_000)
+        
+        results = await asyncio.wait_for(asyncio.gather(*(queue.submit(i) for i in range(3))), timeout=1)
+        
+        assert results == [0, 10, 20]
+        assert calls == [[0, 1, 2]]
+    
+    async def test_flushes_partial_batch_after_window(self, calls):
+        """Test that a partial batch is sent once the batch window elapses."""
+        queue = self.make_queue(calls, batch_size=8, batch_window_ms=5)
+        
+        results = await asyncio.wait_for(asyncio.gather(queue.submit(1), queue.submit(2)), timeout=1)
+        
+        assert results == [10, 20]
+        assert calls == [[1, 2]]
+    
+    async def test_splits_submissions_over_batch_size(self, calls):
+        """Test that more submissions than batch_size are spread over several batches."""
+        queue = self.make_queue(calls, batch_size=2, batch_window_ms=5)
+        
+        results = await asyncio.gather(*(queue.submit(i) for i in range(5)))
+        
+        assert results == [0, 10, 20, 30, 40]
+        assert sorted(len(batch) for batch in calls) == [1, 2, 2]
+    
+    async def test_per_item_exception_fails_only_that_item(self, calls):
+        """Test that an Exception returned for one item doesn't fail its batch mates."""
+        async def batch_fn(items):
+            return [ValueError(item) if item == 1 else item for item in items]
+        queue = self.make_queue(calls, batch_fn, batch_size=3)
+        
+        results = await asyncio.gather(*(queue.submit(i) for i in range(3)), return_exceptions=True)
+        
+        assert results[0] == 0
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 2
+    
+    async def test_batch_fn_error_fails_every_item(self, calls):
+        """Test that an exception raised by batch_fn reaches every submitter in the batch."""
+        async def batch_fn(items):
+            raise RuntimeError("backend down")
+        queue = self.make_queue(calls, batch_fn, batch_size=2)
+        
+        results = await asyncio.gather(queue.submit(1), queue.submit(2), return_exceptions=True)
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+    
+    async def test_short_result_list_fails_leftover_items(self, calls):
+        """Test that submitters without a result fail instead of waiting forever."""
+        async def batch_fn(items):
+            return items[:1]
+        queue = self.make_queue(calls, batch_fn, batch_size=2)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(queue.submit(1), queue.submit(2), return_exceptions=True), timeout=1
+        )
+        
+        assert results[0] == 1
+        assert isinstance(results[1], RuntimeError)
+    
+    async def test_limits_batches_in_flight(self, calls):
+        """Test that no more than max_concurrency batches run at once."""
+        in_flight = 0
+        peak = 0
+        
+        async def batch_fn(items):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return items
+        queue = self.make_queue(calls, batch_fn, batch_size=1, max_concurrency=2)
+        
+        await asyncio.gather(*(queue.submit(i) for i in range(6)))
+        
+        assert peak == 2
+    
+    async def test_rate_limit_spaces_batch_starts(self, calls):
+        """Test that batch starts are spaced by 1 / rate_limit seconds."""
+        starts = []
+        
+        async def batch_fn(items):
+            starts.append(time.monotonic())
+            return items
+        queue = self.make_queue(calls, batch_fn, batch_size=1, rate_limit=50)
+        
+        await asyncio.gather(*(queue.submit(i) for i in range(3)))
+        
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.015 for gap in gaps)
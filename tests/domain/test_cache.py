@@ -0,0 +1,62 @@
+import pytest
+from domain import cache as cache_module
+from domain.cache import MISSING, TTLCache
+
+class TestTTLCache:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the cache's monotonic clock with a manually advanced one."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        return now
+    
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned until it expires."""
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert len(cache) == 1
+    
+    def test_get_distinguishes_missing_from_cached_none(self):
+        """Test that a cached None is returned as None, and absent keys as the default."""
+        cache = TTLCache(maxsize=4, ttl=60.0)
+        cache.set("none", None)
+        
+        assert cache.get("none") is None
+        assert cache.get("absent") is MISSING
+        assert cache.get("absent", "default") == "default"
+    
+    def test_entries_expire_after_ttl(self, clock):
+        """Test that an entry is dropped once its TTL has passed."""
+        cache = TTLCache(maxsize=4, ttl=10.0)
+        cache.set("a", 1)
+        
+        clock[0] += 9.9
+        assert cache.get("a") == 1
+        
+        clock[0] += 0.1
+        assert cache.get("a") is MISSING
+        assert len(cache) == 0
+    
+    def test_set_refreshes_ttl(self, clock):
+        """Test that re-setting a key restarts its TTL."""
+        cache = TTLCache(maxsize=4, ttl=10.0)
+        cache.set("a", 1)
+        clock[0] += 8
+        cache.set("a", 2)
+        clock[0] += 8
+        
+        assert cache.get("a") == 2
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+        assert cache.get("c") == 3
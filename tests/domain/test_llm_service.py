@@ -1,17 +1,12 @@
 import pytest
-from unittest.mock import AsyncMock, patch
-from domain.services.llm_service import LlmService
-from domain.repositories.llm_repository_protocol import LlmRepositoryProtocol
+from domain.services import LlmService
+from tests.fakes import FakeLlmRepository
 
 class TestLlmService:
     @pytest.fixture
     def mock_llm_repository(self):
-        """Create a mock LLM repository."""
-        mock_repo = AsyncMock(spec=LlmRepositoryProtocol)
-        mock_repo.generate_summary.return_value = "This is a generated summary."
-        mock_repo.generate_book_summary.return_value = "This is a generated book summary."
-        mock_repo.generate_review_summary.return_value = "This is a generated review summary."
-        return mock_repo
+        """Create a fake LLM repository."""
+        return FakeLlmRepository()
     
     @pytest.fixture
     def llm_service(self, mock_llm_repository):
@@ -23,7 +18,7 @@ class TestLlmService:
         text = "This is some text to summarize."
         summary = await llm_service.generate_text_summary(text)
         
-        mock_llm_repository.generate_summary.assert_called_once_with(text)
+        assert mock_llm_repository.calls == [("generate_summary", text)]
         assert summary == "This is a generated summary."
     
     async def test_generate_book_summary(self, llm_service, mock_llm_repository):
@@ -32,20 +27,20 @@ class TestLlmService:
         content = "This is the content of the test book."
         summary = await llm_service.generate_book_summary(title, content)
         
-        mock_llm_repository.generate_book_summary.assert_called_once_with(title, content)
+        assert mock_llm_repository.calls == [("generate_book_summary", title, content)]
         assert summary == "This is a generated book summary."
     
-    async def test_generate_review_summary(self, llm_service, mock_llm_repository):
+    async def test_summarize_reviews(self, llm_service, mock_llm_repository):
         """Test generating a review summary."""
         reviews = ["Review 1", "Review 2", "Review 3"]
-        summary = await llm_service.generate_review_summary(reviews)
+        summary = await llm_service.summarize_reviews(reviews)
         
-        mock_llm_repository.generate_review_summary.assert_called_once_with(reviews)
+        assert mock_llm_repository.calls == [("generate_review_summary", reviews)]
         assert summary == "This is a generated review summary."
     
     async def test_repository_error_handling(self, llm_service, mock_llm_repository):
         """Test error handling when the repository raises an exception."""
-        mock_llm_repository.generate_summary.side_effect = RuntimeError("Repository error")
+        mock_llm_repository.error = RuntimeError("Repository error")
         
         with pytest.raises(RuntimeError) as excinfo:
             await llm_service.generate_text_summary("Some text")
@@ -0,0 +1,93 @@
+# tests/fakes.py
+# Hand-written in-memory stand-ins for the repository protocols, shared by the unit tests.
+from typing import AsyncIterator, Dict, List, Optional
+from domain.models import BookDomain, ReviewDomain
+
+
+class FakeBookRepository:
+    """In-memory BookRepositoryProtocol: hands out copies of stored books, like a database would."""
+    
+    def __init__(self, books: List[BookDomain] = ()):
+        self.books: Dict[int, BookDomain] = {}
+        self.calls = []
+        for book in books:
+            self.books[book.id] = book.model_copy()
+    
+    async def get_by_id(self, id: int) -> Optional[BookDomain]:
+        self.calls.append(("get_by_id", id))
+        book = self.books.get(id)
+        return None if book is None else book.model_copy()
+    
+    async def exists(self, id: int) -> bool:
+        self.calls.append(("exists", id))
+        return id in self.books
+    
+    async def get_by_title_and_author(self, title: str, author: str) -> Optional[BookDomain]:
+        self.calls.append(("get_by_title_and_author", title, author))
+        for book in self.books.values():
+            if book.title == title and book.author == author:
+                return book.model_copy()
+        return None
+    
+    async def create(self, entity: BookDomain) -> BookDomain:
+        self.calls.append(("create", entity.model_copy()))
+        if any(book.title == entity.title and book.author == entity.author for book in self.books.values()):
+            # Mirrors the uq_book_title_author constraint
+            raise ValueError("Book with this title and author already exists")
+        created = entity.model_copy(update={"id": max(self.books, default=0) + 1})
+        self.books[created.id] = created
+        return created.model_copy()
+    
+    async def update(self, entity: BookDomain) -> BookDomain:
+        self.calls.append(("update", entity.model_copy()))
+        if entity.id not in self.books:
+            raise ValueError(f"Entity with ID {entity.id} not found")
+        # Only the explicitly set fields are written, as in BasePostgresRepository
+        values = entity.model_dump(exclude_unset=True, exclude={"id"})
+        self.books[entity.id] = self.books[entity.id].model_copy(update=values)
+        return self.books[entity.id].model_copy()
+    
+    async def release_connection(self) -> None:
+        self.calls.append(("release_connection",))
+
+
+class FakeReviewRepository:
+    """In-memory ReviewRepositoryProtocol covering the calls the review application makes."""
+    
+    def __init__(self, reviews: List[ReviewDomain] = ()):
+        self.reviews = [review.model_copy() for review in reviews]
+        self.calls = []
+    
+    async def iter_by_book_id(self, book_id: int, batch_size: int = 500) -> AsyncIterator[ReviewDomain]:
+        self.calls.append(("iter_by_book_id", book_id))
+        for review in self.reviews:
+            if review.book_id == book_id:
+                yield review.model_copy()
+    
+    async def release_connection(self) -> None:
+        self.calls.append(("release_connection",))
+
+
+class FakeLlmRepository:
+    """Hand-written LLM repository double that records calls and returns canned text."""
+    
+    def __init__(self):
+        self.calls = []
+        self.error = None
+    
+    def _record(self, *call):
+        self.calls.append(call)
+        if self.error is not None:
+            raise self.error
+    
+    async def generate_summary(self, text):
+        self._record("generate_summary", text)
+        return "This is a generated summary."
+    
+    async def generate_book_summary(self, book_title, book_content):
+        self._record("generate_book_summary", book_title, book_content)
+        return "This is a generated book summary."
+    
+    async def generate_review_summary(self, reviews):
+        self._record("generate_review_summary", reviews)
+        return "This is a generated review summary."
@@ -0,0 +1,42 @@
+import pytest
+from domain.models import BookDomain, BookWithReviews, ReviewDomain
+from infrastructure.postgres.base_repository import _orm_converter
+from infrastructure.postgres.models import Book, Review
+
+def make_book(**overrides):
+    values = {"id": 1, "title": "Dune", "author": "Frank Herbert", "genre": "Sci-Fi", "year_published": 1965, "summary": None}
+    values.update(overrides)
+    return Book(**values)
+
+class TestOrmConverter:
+    @pytest.mark.parametrize("orm", [
+        make_book(),
+        make_book(genre=None, year_published=None, summary="A desert planet."),
+    ])
+    def test_book_matches_model_validate(self, orm):
+        """Test that the generated converter builds the same book as model_validate."""
+        converted = _orm_converter(BookDomain)(orm)
+        validated = BookDomain.model_validate(orm)
+        
+        assert type(converted) is BookDomain
+        assert converted == validated
+        assert converted.model_fields_set == validated.model_fields_set
+    
+    def test_review_matches_model_validate(self):
+        """Test that the generated converter builds the same review as model_validate."""
+        orm = Review(id=1, book_id=1, user_id=2, review_text=None, rating=4.5)
+        
+        converted = _orm_converter(ReviewDomain)(orm)
+        validated = ReviewDomain.model_validate(orm)
+        
+        assert converted == validated
+        assert converted.model_fields_set == validated.model_fields_set
+    
+    def test_nested_models_are_validated(self):
+        """Test that a model with nested models converts related ORM instances too."""
+        orm = make_book(reviews=[Review(id=1, book_id=1, user_id=2, review_text="Great", rating=5.0)])
+        
+        converted = _orm_converter(BookWithReviews)(orm)
+        
+        assert converted == BookWithReviews.model_validate(orm)
+        assert all(type(review) is ReviewDomain for review in converted.reviews)
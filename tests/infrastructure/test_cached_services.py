@@ -0,0 +1,68 @@
+import pytest
+from application.book_application import BookApplication
+from domain.models import BookDomain
+from infrastructure.cache.cached_services import CachedBookService, book_key
+from tests.fakes import FakeBookRepository
+
+class FakeRedis:
+    """Dict-backed stand-in for the few redis.asyncio calls the cached services make."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def setex(self, key, ttl, value):
+        self.data[key] = value.encode() if isinstance(value, str) else value
+    
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+class TestCachedBookService:
+    @pytest.fixture
+    def book_repository(self):
+        """Create a fake repository holding a single book."""
+        return FakeBookRepository([BookDomain(id=1, title="Dune", author="Frank Herbert", genre="Sci-Fi")])
+    
+    @pytest.fixture
+    def redis(self):
+        """Create a fake Redis client."""
+        return FakeRedis()
+    
+    @pytest.fixture
+    def book_service(self, book_repository, redis):
+        """Create a cached book service on top of the fakes."""
+        return CachedBookService(book_repository, redis)
+    
+    async def test_get_book_is_cached(self, book_service, book_repository, redis):
+        """Test that a second read is served from the cache."""
+        first = await book_service.get_book(1)
+        second = await book_service.get_book(1)
+        
+        assert first == second
+        assert book_key(1) in redis.data
+        assert book_repository.calls == [("get_by_id", 1)]
+    
+    async def test_update_invalidates_cached_book(self, book_service, redis):
+        """Test that an update drops the cached entry, so the next read sees the new row."""
+        book = await book_service.get_book(1)
+        book.genre = "Science Fiction"
+        await book_service.update_book(book)
+        
+        assert book_key(1) not in redis.data
+        assert (await book_service.get_book(1)).genre == "Science Fiction"
+    
+    async def test_update_starts_from_the_stored_row(self, book_service, book_repository):
+        """Test that an update doesn't write back fields from a stale cached copy."""
+        await book_service.get_book(1)  # caches the book
+        # Another writer changes the row behind the cache's back
+        book_repository.books[1] = book_repository.books[1].model_copy(update={"year_published": 1965})
+        
+        app = BookApplication(book_service, review_service=None, llm_service=None)
+        updated = await app.update_book(1, BookDomain(title="Dune", author="Frank Herbert", genre="Space Opera"))
+        
+        assert updated.genre == "Space Opera"
+        assert updated.year_published == 1965
+        assert book_repository.books[1].year_published == 1965
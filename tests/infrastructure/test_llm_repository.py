@@ -0,0 +1,100 @@
+import asyncio
+import gc
+import pytest
+from domain.cache import TTLCache
+from infrastructure.llm import llm_repository as llm_repository_module
+from infrastructure.llm.llm_repository import LlmRepository
+
+class FakeOllamaClient:
+    """Stand-in for ollama.AsyncClient.generate that records prompts and can fail."""
+    
+    def __init__(self):
+        self.prompts = []
+        self.error = None
+    
+    async def generate(self, model, prompt, options):
+        self.prompts.append(prompt)
+        # Long enough for concurrent callers to arrive while the call is in flight
+        await asyncio.sleep(0.02)
+        if self.error is not None:
+            raise self.error
+        return {"response": f" Summary #{len(self.prompts)} "}
+
+class TestLlmRepositoryGenerate:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Serve the repository's Ollama calls from a fake client."""
+        client = FakeOllamaClient()
+        monkeypatch.setattr(llm_repository_module, "get_ollama_client", lambda: client)
+        return client
+    
+    def make_repository(self, ttl=300.0):
+        return LlmRepository(prompt_cache=TTLCache(maxsize=16, ttl=ttl))
+    
+    async def test_concurrent_identical_prompts_share_one_call(self, client):
+        """Test that identical prompts in flight at the same time make a single generate call."""
+        repository = self.make_repository()
+        
+        summaries = await asyncio.gather(*(repository.generate_summary("Same text") for _ in range(5)))
+        
+        assert summaries == ["Summary #1"] * 5
+        assert len(client.prompts) == 1
+        assert repository._in_flight == {}
+    
+    async def test_repeated_prompt_is_cached(self, client):
+        """Test that a repeated prompt is served from the prompt cache."""
+        repository = self.make_repository()
+        
+        first = await repository.generate_summary("Same text")
+        second = await repository.generate_summary("Same text")
+        
+        assert first == second == "Summary #1"
+        assert len(client.prompts) == 1
+    
+    async def test_zero_ttl_bypasses_cache(self, client):
+        """Test that a zero TTL sends every request to the model and caches nothing."""
+        repository = self.make_repository(ttl=0)
+        
+        first = await repository.generate_summary("Same text")
+        second = await repository.generate_summary("Same text")
+        
+        assert (first, second) == ("Summary #1", "Summary #2")
+        assert len(repository.prompt_cache) == 0
+    
+    async def test_failed_generation_is_not_cached(self, client):
+        """Test that a failed generation is retried by the next identical request."""
+        repository = self.make_repository()
+        client.error = ConnectionError("Ollama unreachable")
+        
+        results = await asyncio.gather(
+            repository.generate_summary("Same text"), repository.generate_summary("Same text"),
+            return_exceptions=True,
+        )
+        client.error = None
+        retried = await repository.generate_summary("Same text")
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert retried == "Summary #2"
+        assert len(client.prompts) == 2
+    
+    async def test_failure_after_waiters_cancelled_is_retrieved(self, client):
+        """Test that a failure nobody is left waiting for isn't logged as never retrieved."""
+        repository = self.make_repository()
+        client.error = ConnectionError("Ollama unreachable")
+        unretrieved = []
+        loop = asyncio.get_running_loop()
+        previous_handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda loop, context: unretrieved.append(context))
+        try:
+            waiter = asyncio.create_task(repository.generate_summary("Same text"))
+            await asyncio.sleep(0)
+            (task,) = repository._in_flight.values()
+            waiter.cancel()
+            # Wait without retrieving the exception, then let the task be collected
+            await asyncio.wait([task])
+            del task, waiter
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous_handler)
+        
+        assert unretrieved == []
@@ -0,0 +1,78 @@
+import os
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from domain.models import ReviewDomain
+from infrastructure.postgres.models import Base, Book, BookRatingStats
+from infrastructure.postgres.review_repository import PostgresReviewRepository
+
+TEST_ASYNC_DATABASE_URL = os.getenv("TEST_ASYNC_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    TEST_ASYNC_DATABASE_URL is None, reason="TEST_ASYNC_DATABASE_URL is not set"
+)
+
+# Covers both ends of the 0-5 range and the .5 ties, which round to even in both Python and SQL
+RATINGS = [0.0, 0.4, 0.5, 1.0, 1.5, 2.5, 3.2, 3.5, 4.5, 4.6, 5.0]
+
+class TestReviewStats:
+    @pytest.fixture
+    async def session(self):
+        """Create a session whose work is rolled back at teardown."""
+        engine = create_async_engine(TEST_ASYNC_DATABASE_URL)
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            await conn.run_sync(Base.metadata.create_all)
+            # Repository commits only release a savepoint inside the outer transaction
+            session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            try:
+                yield session
+            finally:
+                await session.close()
+                await transaction.rollback()
+        await engine.dispose()
+    
+    @pytest.fixture
+    async def book_id(self, session):
+        """Create a book to hang the reviews on."""
+        book = Book(title="Dune", author="Frank Herbert", genre="Sci-Fi")
+        session.add(book)
+        await session.flush()
+        return book.id
+    
+    async def read_stats(self, session, book_id):
+        result = await session.execute(
+            select(
+                BookRatingStats.review_count, BookRatingStats.rating_sum,
+                BookRatingStats.rating_1, BookRatingStats.rating_2, BookRatingStats.rating_3,
+                BookRatingStats.rating_4, BookRatingStats.rating_5,
+            ).where(BookRatingStats.book_id == book_id)
+        )
+        count, rating_sum, *buckets = result.one()
+        return count, rating_sum, buckets
+    
+    async def test_increment_matches_recompute(self, session, book_id):
+        """Test that incrementally maintained stats equal stats rebuilt from the reviews."""
+        repository = PostgresReviewRepository(session)
+        for user_id, rating in enumerate(RATINGS, start=1):
+            await repository.create(ReviewDomain(book_id=book_id, user_id=user_id, review_text="Review", rating=rating))
+        incremental = await self.read_stats(session, book_id)
+        
+        await session.execute(repository._recompute_stats(book_id))
+        recomputed = await self.read_stats(session, book_id)
+        
+        assert incremental[0] == recomputed[0] == len(RATINGS)
+        assert incremental[1] == pytest.approx(recomputed[1])
+        assert incremental[2] == recomputed[2] == [4, 2, 1, 2, 2]
+    
+    async def test_delete_recomputes_stats(self, session, book_id):
+        """Test that deleting a review leaves the same stats as never creating it."""
+        repository = PostgresReviewRepository(session)
+        created = [
+            await repository.create(ReviewDomain(book_id=book_id, user_id=user_id, review_text="Review", rating=rating))
+            for user_id, rating in enumerate([2.5, 4.5, 5.0], start=1)
+        ]
+        
+        assert await repository.delete(created[1].id)
+        
+        assert await self.read_stats(session, book_id) == (2, pytest.approx(7.5), [0, 1, 0, 0, 1])
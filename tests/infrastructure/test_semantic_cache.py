@@ -0,0 +1,88 @@
+import pytest
+from infrastructure.llm import semantic_cache as semantic_cache_module
+from infrastructure.llm.semantic_cache import SemanticCache
+
+class TestSemanticCache:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the cache's monotonic clock with a manually advanced one."""
+        now = [1000.0]
+        monkeypatch.setattr(semantic_cache_module.time, "monotonic", lambda: now[0])
+        return now
+    
+    def test_empty_cache_misses(self):
+        """Test that a lookup on an empty cache returns None."""
+        cache = SemanticCache()
+        
+        assert cache.get([1.0, 0.0]) is None
+        assert len(cache) == 0
+    
+    def test_hit_on_similar_embedding(self):
+        """Test that a close enough embedding returns the stored value, regardless of scale."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set([1.0, 0.0, 0.0], "summary")
+        
+        assert cache.get([2.0, 0.1, 0.0]) == "summary"
+    
+    def test_miss_below_threshold(self):
+        """Test that a dissimilar embedding doesn't hit."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set([1.0, 0.0], "summary")
+        
+        assert cache.get([0.0, 1.0]) is None
+        assert cache.get([1.0, 1.0]) is None  # cosine ~0.707
+    
+    def test_returns_most_similar_entry(self):
+        """Test that the closest stored embedding wins."""
+        cache = SemanticCache(threshold=0.5)
+        cache.set([1.0, 0.0], "x")
+        cache.set([0.8, 0.6], "xy")
+        
+        assert cache.get([0.9, 0.45]) == "xy"
+        assert cache.get([1.0, 0.05]) == "x"
+    
+    def test_zero_vectors_are_ignored(self):
+        """Test that zero embeddings are neither stored nor matched."""
+        cache = SemanticCache()
+        cache.set([0.0, 0.0], "zero")
+        cache.set([1.0, 0.0], "x")
+        
+        assert len(cache) == 1
+        assert cache.get([0.0, 0.0]) is None
+    
+    def test_ring_buffer_overwrites_oldest(self):
+        """Test that inserts past max_entries evict the oldest entries first."""
+        cache = SemanticCache(threshold=0.99, max_entries=2)
+        cache.set([1.0, 0.0, 0.0], "a")
+        cache.set([0.0, 1.0, 0.0], "b")
+        cache.set([0.0, 0.0, 1.0], "c")
+        
+        assert len(cache) == 2
+        assert cache.get([1.0, 0.0, 0.0]) is None
+        assert cache.get([0.0, 1.0, 0.0]) == "b"
+        assert cache.get([0.0, 0.0, 1.0]) == "c"
+    
+    def test_expired_entries_are_masked(self, clock):
+        """Test that an expired entry can't win, even when it is the closest match."""
+        cache = SemanticCache(threshold=0.5, ttl=10.0)
+        cache.set([1.0, 0.0], "old")
+        clock[0] += 5
+        cache.set([0.8, 0.6], "fresh")
+        clock[0] += 6  # "old" has expired, "fresh" has not
+        
+        assert cache.get([1.0, 0.0]) == "fresh"
+        
+        clock[0] += 5
+        assert cache.get([1.0, 0.0]) is None
+    
+    def test_dimension_change_resets_cache(self):
+        """Test that a new embedding dimension discards entries from the old model."""
+        cache = SemanticCache(threshold=0.9)
+        cache.set([1.0, 0.0], "2d")
+        
+        assert cache.get([1.0, 0.0, 0.0]) is None
+        
+        cache.set([1.0, 0.0, 0.0], "3d")
+        assert len(cache) == 1
+        assert cache.get([1.0, 0.0, 0.0]) == "3d"
+        assert cache.get([1.0, 0.0]) is None
@@ -0,0 +1,48 @@
+import pytest
+from fastapi import Request
+from pydantic import BaseModel
+from http_cache import HTTP_CACHE_CONTROL, conditional_response
+
+class Payload(BaseModel):
+    title: str
+
+def make_request(if_none_match=None):
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+class TestConditionalResponse:
+    @pytest.fixture
+    def etag(self):
+        """The ETag sent for the default payload."""
+        return conditional_response(make_request(), Payload(title="Dune")).headers["etag"]
+    
+    def test_sends_body_with_cache_headers(self, etag):
+        """Test that a request without If-None-Match gets the JSON body, ETag and Cache-Control."""
+        response = conditional_response(make_request(), Payload(title="Dune"))
+        
+        assert response.status_code == 200
+        assert response.body == b'{"title":"Dune"}'
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == HTTP_CACHE_CONTROL
+    
+    @pytest.mark.parametrize("if_none_match", [
+        "{etag}",
+        "W/{etag}",
+        '"0000000000000000", {etag}',
+        "*",
+    ])
+    def test_matching_etag_is_not_modified(self, etag, if_none_match):
+        """Test that a matching If-None-Match, weak or in a list or *, returns 304 without a body."""
+        response = conditional_response(make_request(if_none_match.format(etag=etag)), Payload(title="Dune"))
+        
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+    
+    def test_changed_payload_changes_etag(self, etag):
+        """Test that a different payload gets a new ETag and a full response to the old one."""
+        response = conditional_response(make_request(etag), Payload(title="Dune Messiah"))
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.body == b'{"title":"Dune Messiah"}'